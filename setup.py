@@ -29,6 +29,7 @@ test_requires = [
     'pytest-mock>=3.10.0',
     'pytest-cov>=4.0.0',
     'pytest-timeout>=2.1.0',
+    'pytest-xdist>=3.0.0',
 ]
 
 setup(
@@ -41,8 +41,19 @@ def cli():
 @click.option('--interval', '-i', default=1.0, help='Monitoring interval in seconds')
 @click.option('--duration', '-d', default=None, type=int, help='Monitoring duration in seconds')
 @click.option('--export', '-e', is_flag=True, help='Export monitoring data to CSV')
-def monitor(interval: float, duration: Optional[int], export: bool):
+@click.option('--refresh-hz',
+              type=click.FloatRange(min=0.1, min_open=False),
+              default=1.0,
+              help='Screen redraws per second')
+@click.option('--sample-hz',
+              type=click.FloatRange(min=0.1, min_open=False),
+              default=None,
+              help='Samples per second (overrides --interval)')
+def monitor(interval: float, duration: Optional[int], export: bool,
+            refresh_hz: float, sample_hz: Optional[float]):
     """📊 Monitor system resources and performance in real-time"""
+    if sample_hz is not None:
+        interval = 1.0 / sample_hz
     try:
         mon = SystemMonitor()
         if export:
@@ -52,7 +63,8 @@ def monitor(interval: float, duration: Optional[int], export: bool):
             mon.run_performance_test(
                 interval=interval,
                 duration=duration,
-                export_data=export
+                export_data=export,
+                refresh_hz=refresh_hz
             )
     except KeyboardInterrupt:
         console.print("\n[yellow]Monitoring stopped by user[/yellow]")
@@ -136,15 +148,26 @@ def gpu():
               type=click.IntRange(min=1, min_open=False),
               default=10,
               help='Duration to run in seconds')
-def heatmap(interval: float, duration: int):
+@click.option('--refresh-hz',
+              type=click.FloatRange(min=0.1, min_open=False),
+              default=1.0,
+              help='Screen redraws per second')
+@click.option('--sample-hz',
+              type=click.FloatRange(min=0.1, min_open=False),
+              default=None,
+              help='Samples per second (overrides --interval)')
+def heatmap(interval: float, duration: int, refresh_hz: float, sample_hz: Optional[float]):
     """🌡️ Display unified system temperature heatmap"""
+    if sample_hz is not None:
+        interval = 1.0 / sample_hz
     try:
         hm = SystemHeatmap()
 
         with console.status("[bold green]Initializing system heatmap..."):
             updates = hm.run(
                 interval=interval,
-                duration=duration
+                duration=duration,
+                refresh_hz=refresh_hz
             )
 
         console.print(f"\n[green]Heatmap completed after {updates} updates[/green]")
@@ -193,6 +216,8 @@ def network(interfaces: bool, speed: bool, show_connections: bool,
                 export=export
             )
     except KeyboardInterrupt:
+        # --speed/--connections and dashboard setup; the dashboard loop handles
+        # Ctrl-C itself and prints the same message on its way out
         console.print("\n[yellow]Network monitoring stopped by user[/yellow]")
     except Exception:
         console.print("\n[red]Error during network monitoring. Check logs for details.[/red]")
@@ -1,8 +1,11 @@
 import time
 import logging
+import functools
+import importlib
+import importlib.util
 import threading
 import numpy as np
-from typing import Dict
+from typing import Callable, Dict
 
 from rich.console import Console
 from rich.panel import Panel
@@ -10,22 +13,33 @@ from rich.live import Live
 from rich.table import Table
 
 import psutil
-import platform
 
-try:
-    import GPUtil
-    HAS_GPU_STATS = True
-except ImportError:
-    HAS_GPU_STATS = False
+from .utils import system_facts
+
+# GPUtil is only located here; importing it is deferred to _gputil()
+HAS_GPU_STATS = importlib.util.find_spec('GPUtil') is not None
 
 logger = logging.getLogger(__name__)
 
+POLL_INTERVAL = 0.1  # seconds between GPU/memory samples
+
+
+@functools.lru_cache(maxsize=1)
+def _gputil():
+    """Import GPUtil once, on first use; None if it fails to import."""
+    try:
+        return importlib.import_module('GPUtil')
+    except ImportError:
+        logger.debug("GPUtil is installed but could not be imported", exc_info=True)
+        return None
+
 
 class SafeSystemBenchmark:
     def __init__(self):
         self.console = Console()
         self.results: Dict = {}
         self._stop_event = threading.Event()
+        self._rng = np.random.default_rng()
         # Safety thresholds — these are for *monitoring*, not for killing benchmarks
         self.MAX_CPUSAFE = 98        # 98% CPU is reasonable during a benchmark
         self.MAX_MEMORY_USAGE = 95    # 95% memory before we worry
@@ -46,9 +60,10 @@ class SafeSystemBenchmark:
         """Check if GPU is available and get GPU information"""
         gpu_info: Dict = {'available': False, 'gpus': []}
 
-        if HAS_GPU_STATS:
+        gputil = _gputil() if HAS_GPU_STATS else None
+        if gputil is not None:
             try:
-                gpus = GPUtil.getGPUs()
+                gpus = gputil.getGPUs()
                 if gpus:
                     gpu_info['available'] = True
                     for gpu in gpus:
@@ -63,28 +78,32 @@ class SafeSystemBenchmark:
 
     def get_system_info(self) -> Dict:
         """Get basic system information"""
+        facts = system_facts()
         info: Dict = {
-            'system': platform.system(),
-            'processor': platform.processor(),
+            'system': facts.system,
+            'processor': facts.processor,
             'memory_total': psutil.virtual_memory().total,
-            'cpu_cores': psutil.cpu_count(logical=False),
-            'cpu_threads': psutil.cpu_count(logical=True),
+            'cpu_cores': facts.physical_cores,
+            'cpu_threads': facts.logical_cores,
             'gpus': self.has_gpu['gpus'] if self.has_gpu['available'] else []
         }
         return info
 
-    def safe_gpu_test(self, duration: float) -> Dict:
+    def safe_gpu_test(self, duration: float, clock: Callable[[], float] = time.monotonic,
+                      sleep: Callable[[float], object] = time.sleep) -> Dict:
         """Safe GPU benchmark with controlled load for all GPUs"""
         if not self.has_gpu['available']:
             return {'times': [], 'loads': [], 'error': 'No GPU available'}
 
         result: Dict = {'times': [], 'gpu_stats': []}
-        start_time = time.time()
+        gputil = _gputil() if HAS_GPU_STATS else None
+        start_time = clock()
+        next_sample = start_time
 
         try:
-            while time.time() - start_time < duration and not self._stop_event.is_set():
-                if HAS_GPU_STATS:
-                    gpus = GPUtil.getGPUs()
+            while clock() - start_time < duration and not self._stop_event.is_set():
+                if gputil is not None:
+                    gpus = gputil.getGPUs()
                     if gpus:
                         current_stats = []
                         for gpu in gpus:
@@ -93,10 +112,12 @@ class SafeSystemBenchmark:
                                 'memory_usage': gpu.memoryUsed
                             })
 
-                        result['times'].append(time.time() - start_time)
+                        result['times'].append(clock() - start_time)
                         result['gpu_stats'].append(current_stats)
 
-                time.sleep(0.1)
+                # Sample on a fixed grid so getGPUs() latency does not stretch the cadence
+                next_sample = max(next_sample + POLL_INTERVAL, clock())
+                sleep(max(0.0, next_sample - clock()))
 
         except Exception:
             logger.exception("Error during GPU benchmark")
@@ -116,33 +137,38 @@ class SafeSystemBenchmark:
                 self.console.print("[red]Warning: System resource usage dangerously high. Stopping benchmark.[/red]")
                 break
 
-    def safe_cpu_test(self, duration: float) -> Dict:
+    def safe_cpu_test(self, duration: float, clock: Callable[[], float] = time.monotonic) -> Dict:
         """CPU benchmark — continuous matrix multiplication, no sleep dominating the loop"""
-        start_time = time.time()
+        start_time = clock()
         result: Dict = {'times': [], 'loads': []}
 
         # Warm up cpu_percent counter
         psutil.cpu_percent(interval=None)
 
-        while time.time() - start_time < duration and not self._stop_event.is_set():
-            # Use larger matrices for a meaningful workload
-            size = 500
-            matrix = np.random.rand(size, size)
-            _ = np.dot(matrix, matrix.T)
+        # Use larger matrices for a meaningful workload; refilled in place each round
+        size = 500
+        matrix = np.empty((size, size))
+        product = np.empty((size, size))
+
+        while clock() - start_time < duration and not self._stop_event.is_set():
+            self._rng.random(out=matrix)
+            np.dot(matrix, matrix.T, out=product)
 
-            result['times'].append(time.time() - start_time)
+            result['times'].append(clock() - start_time)
             result['loads'].append(psutil.cpu_percent(interval=None))
 
         return result
 
-    def safe_memory_test(self, duration: float) -> Dict:
+    def safe_memory_test(self, duration: float, clock: Callable[[], float] = time.monotonic,
+                         sleep: Callable[[float], object] = time.sleep) -> Dict:
         """Memory benchmark — allocates and operates on increasingly large buffers"""
-        start_time = time.time()
+        start_time = clock()
+        next_sample = start_time
         result: Dict = {'times': [], 'usage': [], 'bandwidth_mbps': []}
         allocated = []
 
         try:
-            while time.time() - start_time < duration and not self._stop_event.is_set():
+            while clock() - start_time < duration and not self._stop_event.is_set():
                 # Allocate a 10MB chunk and perform copy operations
                 chunk_size = 10 * 1024 * 1024 // 8  # 10MB worth of float64
                 buf = np.zeros(chunk_size, dtype=np.float64)
@@ -151,7 +177,7 @@ class SafeSystemBenchmark:
                 allocated.append(buf)
                 allocated.append(buf_copy)
 
-                result['times'].append(time.time() - start_time)
+                result['times'].append(clock() - start_time)
                 mem = psutil.virtual_memory()
                 result['usage'].append(mem.percent)
 
@@ -159,7 +185,8 @@ class SafeSystemBenchmark:
                 if mem.percent > 90:
                     break
 
-                time.sleep(0.1)
+                next_sample = max(next_sample + POLL_INTERVAL, clock())
+                sleep(max(0.0, next_sample - clock()))
 
         except MemoryError:
             result['memory_error'] = True
@@ -169,7 +196,9 @@ class SafeSystemBenchmark:
 
         return result
 
-    def mini_test(self, gpu_only: bool = False, cpu_only: bool = False):
+    def mini_test(self, gpu_only: bool = False, cpu_only: bool = False,
+                  clock: Callable[[], float] = time.monotonic,
+                  sleep: Callable[[float], object] = time.sleep):
         """Run 30-second mini benchmark"""
         self._stop_event.clear()
         duration = 30
@@ -187,13 +216,13 @@ class SafeSystemBenchmark:
 
                 if not gpu_only:
                     # CPU Test — half duration
-                    self.results['cpu'] = self.safe_cpu_test(duration / 2)
+                    self.results['cpu'] = self.safe_cpu_test(duration / 2, clock)
                     # Memory Test — half duration
-                    self.results['memory'] = self.safe_memory_test(duration / 2)
+                    self.results['memory'] = self.safe_memory_test(duration / 2, clock, sleep)
 
                 if not cpu_only and self.has_gpu['available']:
                     # GPU Test
-                    self.results['gpu'] = self.safe_gpu_test(duration / 2)
+                    self.results['gpu'] = self.safe_gpu_test(duration / 2, clock, sleep)
 
                 live.update(self.generate_status_table())
         finally:
@@ -202,7 +231,9 @@ class SafeSystemBenchmark:
 
         self.display_results("Mini-Test")
 
-    def god_test(self, gpu_only: bool = False, cpu_only: bool = False):
+    def god_test(self, gpu_only: bool = False, cpu_only: bool = False,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], object] = time.sleep):
         """Running GOD-LEVEL comprehensive benchmark"""
         self._stop_event.clear()
         duration = 60
@@ -220,13 +251,13 @@ class SafeSystemBenchmark:
 
                 if not gpu_only:
                     # Extended CPU Test
-                    self.results['cpu'] = self.safe_cpu_test(duration / 2)
+                    self.results['cpu'] = self.safe_cpu_test(duration / 2, clock)
                     # Extended Memory Test
-                    self.results['memory'] = self.safe_memory_test(duration / 2)
+                    self.results['memory'] = self.safe_memory_test(duration / 2, clock, sleep)
 
                 if not cpu_only and self.has_gpu['available']:
                     # Extended GPU Test
-                    self.results['gpu'] = self.safe_gpu_test(duration / 2)
+                    self.results['gpu'] = self.safe_gpu_test(duration / 2, clock, sleep)
 
                 live.update(self.generate_status_table())
         finally:
@@ -247,9 +278,10 @@ class SafeSystemBenchmark:
         table.add_row("CPU Usage", f"{cpu_percent}%")
         table.add_row("Memory Usage", f"{memory_percent}%")
 
-        if self.has_gpu['available'] and HAS_GPU_STATS:
+        gputil = _gputil() if HAS_GPU_STATS else None
+        if self.has_gpu['available'] and gputil is not None:
             try:
-                gpus = GPUtil.getGPUs()
+                gpus = gputil.getGPUs()
                 if gpus:
                     for i, gpu in enumerate(gpus):
                         table.add_row(f"GPU {i}", f"[green]{gpu.name}[/green]")
@@ -3,21 +3,29 @@ import psutil
 import platform
 import logging
 import subprocess
+import threading
 import os
+import re
+import json
+import bisect
+import functools
+import weakref
+import http.client
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from ctypes import Structure
 
 from rich.live import Live
 from rich.console import Console
 from rich.panel import Panel
-from rich.text import Text
+from rich.text import Span, Text
 from rich.table import Table
 from rich.layout import Layout
 from rich import box
 
-from .utils import ASCIIGraph
+from .utils import ASCIIGraph, BackgroundSampler, Sample
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +46,317 @@ if platform.system() == "Windows":
         ]
 
 
+LAYOUT_ROWS, LAYOUT_COLS = 25, 40
+_ROW_DTYPE = np.dtype(('U', LAYOUT_COLS))
+
+# Heatmap cell classification: temps below 45°C are cool, below 70°C warm, else hot.
+# Scalar lookups index _TEMP_CHAR_LUT; whole grids go through np.digitize(_TEMP_BINS).
+_TEMP_THRESHOLDS = (45.0, 70.0)
+_TEMP_BINS = np.array(_TEMP_THRESHOLDS, dtype=np.float32)  # same dtype as temp_maps: digitize casts nothing
+_CHAR_TABLE = np.array(['·', '▒', '█'])
+_COLOR_TABLE = ("green", "yellow", "red")
+# (char, color) per whole degree 0-100. Exact for any t in [0, 101) because the
+# thresholds are whole degrees, so int(t) never crosses one.
+_TEMP_CHAR_LUT = tuple(
+    (str(_CHAR_TABLE[k]), _COLOR_TABLE[k])
+    for k in (bisect.bisect_right(_TEMP_THRESHOLDS, t) for t in range(101))
+)
+# Style index per layout cell: 0 = empty, 1..3 = cool/warm/hot, 4 = label text
+_CELL_STYLES = (None,) + _COLOR_TABLE + ("white",)
+_LABEL_STYLE = 4
+
+
+def _fill_noisy_map(temp_map: np.ndarray, temp: float, noise: np.ndarray):
+    """temp_map = clip(temp + 2 * noise, 0, 100), written in place."""
+    np.multiply(noise, 2.0, out=temp_map)
+    np.add(temp_map, temp, out=temp_map)
+    np.clip(temp_map, 0, 100, out=temp_map)
+
+
+def _fill_noisy_maps(temps_flat: np.ndarray, cell_temps: np.ndarray, noise: np.ndarray):
+    """Every component map in one pass over the shared buffer; cell_temps holds each cell's component temp."""
+    np.multiply(noise, 2.0, out=temps_flat)
+    np.add(temps_flat, cell_temps, out=temps_flat)
+    np.clip(temps_flat, 0, 100, out=temps_flat)
+
+
+# Load-based estimates when no sensor is readable: (component, base °C, °C per % CPU).
+# RAM follows memory usage instead.
+_CPU_LOAD_TEMP_MODEL = (
+    ('CPU', 35.0, 0.5),
+    ('GPU', 35.0, 0.4),
+    ('Motherboard', 30.0, 0.2),
+    ('Storage', 25.0, 0.15),
+)
+_RAM_BASE_TEMP, _RAM_TEMP_SLOPE = 30.0, 0.3
+
+_VIRTUAL_BLOCK_PREFIXES = ('loop', 'ram', 'zram', 'dm-', 'sr')
+
+# Thermal zone types that are never polled. Wireless firmware zones can block
+# for hundreds of milliseconds per read (cf. IgnoreThermalZones in thermald).
+_IGNORED_THERMAL_ZONES = ('iwlwifi',)
+
+# First "<number>°C" in an lm-sensors value such as "+45.0°C  (high = +80.0°C)"
+_TEMP_RE = re.compile(r'([+-]?\d+(?:\.\d+)?)\s*°C')
+
+_CPU_SENSOR_KEYS = ('cpu', 'package', 'core', 'tdie', 'tctl')
+_GPU_SENSOR_KEYS = ('gpu', 'edge', 'junction', 'mem')
+_BOARD_SENSOR_KEYS = ('mb', 'board', 'systin', 'cputin')
+
+
+@functools.lru_cache(maxsize=256)  # the same few (chip, label) pairs come back every poll
+def _classify_sensor(chip: str, label: str) -> Optional[str]:
+    """Map an lm-sensors/hwmon (chip, label) pair to a heatmap component."""
+    label = label.lower()
+    if any(k in label for k in _CPU_SENSOR_KEYS):
+        return 'CPU'
+    if any(k in label for k in _GPU_SENSOR_KEYS) or 'gpu' in chip.lower():
+        return 'GPU'
+    if any(k in label for k in _BOARD_SENSOR_KEYS):
+        return 'Motherboard'
+    return None
+
+
+class _SensorsBackend:
+    """Reads hwmon temperature inputs straight from sysfs.
+
+    The hwmon tree is walked once and every ``temp*_input`` is held open; each
+    poll is then one ``os.pread`` per input instead of fork/exec'ing ``sensors``.
+    """
+
+    def __init__(self, root: Path = Path('/sys/class/hwmon')):
+        self.root = root
+        self._inputs: Optional[List[Tuple[str, str, int]]] = None
+
+    def _discover(self) -> List[Tuple[str, str, int]]:
+        inputs: List[Tuple[str, str, int]] = []
+        try:
+            hwmons = sorted(self.root.glob('hwmon*'))
+        except OSError:
+            return inputs
+        for hwmon in hwmons:
+            try:
+                chip = (hwmon / 'name').read_text().strip()
+            except OSError:
+                chip = hwmon.name
+            for temp_input in sorted(hwmon.glob('temp*_input')):
+                label_file = hwmon / temp_input.name.replace('_input', '_label')
+                try:
+                    label = label_file.read_text().strip()
+                except OSError:
+                    label = chip
+                try:
+                    inputs.append((chip, label, os.open(temp_input, os.O_RDONLY)))
+                except OSError:
+                    continue
+        return inputs
+
+    def read(self) -> Optional[List[Tuple[str, str, float]]]:
+        """Return (chip, label, °C) readings, or None when no hwmon inputs exist."""
+        if self._inputs is None:
+            self._inputs = self._discover()
+        if not self._inputs:
+            return None
+        readings = []
+        for chip, label, fd in self._inputs:
+            try:
+                readings.append((chip, label, int(os.pread(fd, 16, 0)) / 1000.0))
+            except (OSError, ValueError):
+                continue
+        return readings
+
+    def close(self):
+        for _, _, fd in self._inputs or ():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._inputs = None
+
+
+class _ThermalZones:
+    """CPU/GPU thermal zones with their ``temp`` files held open.
+
+    Zone types are read once; each poll is a single ``os.pread`` per zone
+    instead of a path lookup and open.
+    """
+
+    def __init__(self, root: Path = Path('/sys/class/thermal'),
+                 ignore: Tuple[str, ...] = _IGNORED_THERMAL_ZONES):
+        self.root = root
+        self.ignore = ignore
+        self._zones: Optional[List[Tuple[str, int]]] = None
+
+    def _open(self) -> List[Tuple[str, int]]:
+        zones: List[Tuple[str, int]] = []
+        try:
+            paths = sorted(self.root.glob('thermal_zone*'))
+        except OSError:
+            return zones
+        for zone in paths:
+            try:
+                zone_type = (zone / 'type').read_text().strip().lower()
+            except OSError:
+                continue
+            if zone_type.startswith(self.ignore):
+                continue
+            if 'cpu' in zone_type:
+                component = 'CPU'
+            elif 'gpu' in zone_type:
+                component = 'GPU'
+            else:
+                continue
+            try:
+                zones.append((component, os.open(zone / 'temp', os.O_RDONLY)))
+            except OSError:
+                continue
+        return zones
+
+    def read(self) -> List[Tuple[str, float]]:
+        """Return (component, °C) readings for the CPU/GPU zones."""
+        if self._zones is None:
+            self._zones = self._open()
+        readings = []
+        for component, fd in self._zones:
+            try:
+                readings.append((component, int(os.pread(fd, 16, 0)) / 1000.0))
+            except (OSError, ValueError):
+                continue
+        return readings
+
+    def close(self):
+        for _, fd in self._zones or ():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._zones = None
+
+
+# LibreHardwareMonitor identifies hardware by icon name (data.json) or by
+# identifier prefix (WMI, e.g. "/intelcpu/0/temperature/0"); both map onto
+# heatmap components without matching every sensor name.
+_LHM_HARDWARE_KEYS = (
+    ('cpu', 'CPU'),
+    ('gpu', 'GPU'),
+    ('nvidia', 'GPU'),
+    ('mainboard', 'Motherboard'),
+    ('lpc', 'Motherboard'),
+    ('hdd', 'Storage'),
+    ('nvme', 'Storage'),
+    ('ssd', 'Storage'),
+)
+
+
+def _lhm_hardware_component(token: str) -> Optional[str]:
+    token = token.lower()
+    if token == 'ati':
+        return 'GPU'
+    for key, component in _LHM_HARDWARE_KEYS:
+        if key in token:
+            return component
+    return None
+
+
+# Filtered and projected by the WMI provider, so only temperature sensors (and
+# only the three properties read) are marshalled through COM on each poll
+_WMI_TEMPERATURE_QUERY = "SELECT Identifier, Name, Value FROM Sensor WHERE SensorType = 'Temperature'"
+
+
+def _classify_lhm_sensor(hardware: str, name: str) -> Optional[str]:
+    """Map a LibreHardwareMonitor/OpenHardwareMonitor temperature sensor to a component."""
+    component = _lhm_hardware_component(hardware)
+    if component is not None:
+        return component
+    if 'CPU' in name:
+        return 'CPU'
+    if 'GPU' in name:
+        return 'GPU'
+    if 'Motherboard' in name:
+        return 'Motherboard'
+    if 'Drive' in name:
+        return 'Storage'
+    return None
+
+
+class _LhmHttp:
+    """Pulls LibreHardwareMonitor's web server JSON over one keep-alive connection.
+
+    LHM (v0.9.5+) serves every sensor at ``/data.json``; one HTTP round-trip is
+    far cheaper than a WMI query that marshals every sensor through COM.
+    """
+
+    RETRY_INTERVAL = 30.0  # seconds to wait before retrying an unreachable server
+
+    def __init__(self, host: str = 'localhost', port: int = 8085, timeout: float = 1.0):
+        self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        self._components: Dict[str, Optional[str]] = {}
+        self._next_try = 0.0
+
+    def read(self) -> Optional[List[Tuple[str, float]]]:
+        """Return (component, °C) readings, or None when the server is unavailable."""
+        now = time.monotonic()
+        if now < self._next_try:
+            return None
+        try:
+            self._conn.request('GET', '/data.json')
+            response = self._conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise http.client.HTTPException(f"HTTP {response.status}")
+            tree = json.loads(body)
+        except (OSError, http.client.HTTPException, ValueError):
+            self._conn.close()
+            self._next_try = now + self.RETRY_INTERVAL
+            return None
+
+        readings: List[Tuple[str, float]] = []
+        self._collect(tree, '', readings)
+        return readings
+
+    def _collect(self, node: Dict, hardware: str, readings: List[Tuple[str, float]]):
+        icon = os.path.splitext(os.path.basename(node.get('ImageURL', '')))[0]
+        if _lhm_hardware_component(icon) is not None:
+            hardware = icon
+        value = node.get('Value', '')
+        if not node.get('Children') and value.endswith('°C'):
+            sensor_id = str(node.get('SensorId') or node.get('id'))
+            if sensor_id not in self._components:
+                self._components[sensor_id] = _classify_lhm_sensor(hardware, node.get('Text', ''))
+            component = self._components[sensor_id]
+            if component is not None:
+                try:
+                    readings.append((component, float(value.split()[0].replace(',', '.'))))
+                except (ValueError, IndexError):
+                    pass
+        for child in node.get('Children', ()):
+            self._collect(child, hardware, readings)
+
+
 class SystemHeatmap:
+    # smartd itself defaults to 30 min; polling SMART every frame causes I/O stalls
+    SMART_INTERVAL = 300  # seconds
+    # Drive temperatures move over tens of seconds; poll them less often than CPU/GPU
+    STORAGE_INTERVAL = 10  # seconds
+    # Spawning `sensors` costs tens of ms; only done when sysfs exposes no hwmon
+    LM_SENSORS_INTERVAL = 2  # seconds
+    # generate_system_layout() without temps reuses a reading this recent
+    TEMPS_MAX_AGE = 1.0  # seconds
+    # Console() probes the terminal; one is built lazily and shared by every instance
+    _console: Optional[Console] = None
+
     def __init__(self):
-        self.console = Console()
+        if SystemHeatmap._console is None:
+            SystemHeatmap._console = Console()
+        self.console = SystemHeatmap._console
         self.history_size = 60
         self.system = platform.system()
+        # Per-OS reader resolved once instead of comparing strings every read
+        self._read_temps = {
+            "Windows": self.get_windows_temps,
+            "Linux": self.get_linux_temps,
+            "Darwin": self.get_macos_temps,
+        }.get(self.system, self.get_fallback_temps)
         self.components: Dict[str, Dict] = {
             'CPU': {'position': (2, 5), 'size': (8, 15)},
             'GPU': {'position': (12, 5), 'size': (8, 15)},
@@ -50,23 +364,54 @@ class SystemHeatmap:
             'RAM': {'position': (2, 25), 'size': (4, 10)},
             'Storage': {'position': (18, 25), 'size': (4, 10)}
         }
+        self._rng = np.random.default_rng()
         self.initialize_temp_maps()
         self.temp_history: Dict[str, ASCIIGraph] = {
             'CPU': ASCIIGraph(width=30, height=5),
             'GPU': ASCIIGraph(width=30, height=5)
         }
+        self._sensors_backend = _SensorsBackend()
+        self._thermal_zones = _ThermalZones()
+        self._row_cache: Dict[int, Tuple[Tuple[str, bytes], List[Span]]] = {}
+        # generate_system_layout swaps each frame's Text into this Panel and returns it
+        self._layout_panel = Panel(Text(), title="Internal Thermal Map", border_style="blue")
+        # Built on the first run and restarted by later ones
+        self._live: Optional[Live] = None
+        self._block_devices: Optional[List[str]] = None
+        self._storage_hwmon_fds: Optional[List[int]] = None
+        self._last_storage_ts = float('-inf')
+        self._last_lm_sensors_ts = float('-inf')
+        self._lm_sensors_readings: List[Tuple[str, str, float]] = []
+        self._storage_temp: Optional[float] = None
+        self._last_smart_ts = float('-inf')
+        self._smart_temp: Optional[float] = None
+        self._smart_thread: Optional[threading.Thread] = None
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._last_temps_ts = float('-inf')
+        self._last_temps: Optional[Dict[str, float]] = None
+        self._lhm_http: Optional[_LhmHttp] = None
+        self.wmi_connection = None
+        self._wmi_components: Dict[str, Optional[str]] = {}
         if self.system == "Windows":
             self._setup_windows_api()
 
     def _setup_windows_api(self):
-        if platform.system() != "Windows":
+        if self.system != "Windows":
             return
-        self.wmi_connection = None
+        self._lhm_http = _LhmHttp()
         try:
             import wmi  # type: ignore
-            self.wmi_connection = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-        except Exception:
-            logger.debug("OpenHardwareMonitor WMI not available, using fallback temps")
+        except ImportError:
+            wmi = None
+            logger.debug("wmi module not available, using fallback temps")
+        for namespace in ("root\\LibreHardwareMonitor", "root\\OpenHardwareMonitor"):
+            if wmi is None:
+                break
+            try:
+                self.wmi_connection = wmi.WMI(namespace=namespace)
+                break
+            except Exception:
+                logger.debug("%s WMI namespace not available", namespace)
 
         try:
             self.GetSystemPowerStatus = windll.kernel32.GetSystemPowerStatus
@@ -76,67 +421,203 @@ class SystemHeatmap:
             logger.debug("Windows power status API not available")
 
     def initialize_temp_maps(self):
-        self.temp_maps: Dict[str, np.ndarray] = {
-            component: np.zeros(dims['size'])
-            for component, dims in self.components.items()
-        }
+        # Every component map is a view into one contiguous float32 buffer, and its
+        # scratch noise a view into a second one, so a frame can refill all noise
+        # with a single RNG call. float32 is plenty for display temperatures.
+        total = sum(rows * cols for rows, cols in (d['size'] for d in self.components.values()))
+        self._temps_flat = np.zeros(total, dtype=np.float32)
+        self._noise_flat = np.empty(total, dtype=np.float32)
+        self.temp_maps: Dict[str, np.ndarray] = {}
+        self._noise: Dict[str, np.ndarray] = {}
+        offset = 0
+        for component, dims in self.components.items():
+            rows, cols = dims['size']
+            cells = slice(offset, offset + rows * cols)
+            self.temp_maps[component] = self._temps_flat[cells].reshape(rows, cols)
+            self._noise[component] = self._noise_flat[cells].reshape(rows, cols)
+            offset += rows * cols
+        # Component index of every cell, so per-frame temps broadcast with one np.take
+        self._cell_component = np.repeat(
+            np.arange(len(self.components), dtype=np.intp),
+            [rows * cols for rows, cols in (d['size'] for d in self.components.values())],
+        )
+        self._component_temps = np.empty(len(self.components), dtype=np.float32)
+        self._cell_temps = np.empty(total, dtype=np.float32)
+
+    def get_windows_temps(self, sample: Optional[Sample] = None) -> Dict[str, float]:
+        if sample is None:
+            sample = Sample.take()
+        temps = self.get_fallback_temps(sample)
+
+        readings = self._lhm_http.read() if self._lhm_http else None
+        if readings is None and self.wmi_connection:
+            readings = self._read_wmi_sensors()
+
+        gpu_temps: List[float] = []
+        for component, value in readings or ():
+            if component == 'GPU':
+                gpu_temps.append(value)
+            elif component in ('CPU', 'Motherboard', 'Storage'):
+                temps[component] = max(temps[component], value)
+        if gpu_temps:
+            temps['GPU'] = max(gpu_temps)
+
+        temps['RAM'] = self.get_ram_temp(sample)
+        return temps
 
-    def get_windows_temps(self) -> Dict[str, float]:
-        temps = self.get_fallback_temps()
+    def _read_wmi_sensors(self) -> Optional[List[Tuple[str, float]]]:
+        """Fallback to the (Libre|Open)HardwareMonitor WMI provider."""
+        readings: List[Tuple[str, float]] = []
+        try:
+            for sensor in self.wmi_connection.query(_WMI_TEMPERATURE_QUERY):
+                if sensor.Identifier not in self._wmi_components:
+                    hardware = sensor.Identifier.strip('/').split('/')[0]
+                    self._wmi_components[sensor.Identifier] = _classify_lhm_sensor(hardware, sensor.Name)
+                component = self._wmi_components[sensor.Identifier]
+                if component is not None:
+                    readings.append((component, float(sensor.Value)))
+        except Exception:
+            logger.debug("Error reading WMI sensors, using fallback temps")
+            return None
+        return readings
 
-        if self.wmi_connection:
-            try:
-                sensors = self.wmi_connection.Sensor()
-                gpu_temps: List[float] = []
-                for sensor in sensors:
-                    if sensor.SensorType == 'Temperature':
-                        value = float(sensor.Value)
-                        if 'CPU' in sensor.Name and temps['CPU'] < value:
-                            temps['CPU'] = value
-                        elif 'GPU' in sensor.Name:
-                            gpu_temps.append(value)
-                        elif 'Motherboard' in sensor.Name and temps['Motherboard'] < value:
-                            temps['Motherboard'] = value
-                        elif 'Drive' in sensor.Name and temps['Storage'] < value:
-                            temps['Storage'] = value
-                if gpu_temps:
-                    temps['GPU'] = max(gpu_temps)
-            except Exception:
-                logger.debug("Error reading WMI sensors, using fallback temps")
+    def get_linux_temps(self, sample: Optional[Sample] = None) -> Dict[str, float]:
+        if sample is None:
+            sample = Sample.take()
+        temps = self.get_fallback_temps(sample)
 
-        temps['RAM'] = self.get_ram_temp()
+        # Read from sysfs thermal zones
+        for component, temp in self._thermal_zones.read():
+            temps[component] = max(temps[component], temp)
+
+        # hwmon via sysfs; lm-sensors subprocess only when sysfs exposes nothing
+        now = time.monotonic()
+        readings = self._sensors_backend.read()
+        if readings is None:
+            if now - self._last_lm_sensors_ts >= self.LM_SENSORS_INTERVAL:
+                self._last_lm_sensors_ts = now
+                self._lm_sensors_readings = self._read_lm_sensors()
+            readings = self._lm_sensors_readings
+        gpu_temps: List[float] = []
+        for chip, label, temp in readings:
+            component = _classify_sensor(chip, label)
+            if component == 'CPU':
+                temps['CPU'] = max(temps['CPU'], temp)
+            elif component == 'GPU':
+                gpu_temps.append(temp)
+            elif component == 'Motherboard':
+                temps['Motherboard'] = max(temps['Motherboard'], temp)
+        if gpu_temps:
+            temps['GPU'] = max(gpu_temps)
+
+        if now - self._last_storage_ts >= self.STORAGE_INTERVAL:
+            self._last_storage_ts = now
+            self._storage_temp = self._get_storage_temp()
+        storage_temp = self._storage_temp
+        if storage_temp is not None:
+            temps['Storage'] = max(temps['Storage'], storage_temp)
+
+        temps['RAM'] = self.get_ram_temp(sample)
         return temps
 
-    def get_linux_temps(self) -> Dict[str, float]:
-        temps = self.get_fallback_temps()
-
-        # Read from sysfs thermal zones
-        try:
-            thermal_zones = Path('/sys/class/thermal').glob('thermal_zone*')
-            for zone in thermal_zones:
-                try:
-                    with open(zone / 'type') as f:
-                        zone_type = f.read().strip()
-                    with open(zone / 'temp') as f:
-                        temp = float(f.read().strip()) / 1000.0
-
-                    if 'cpu' in zone_type.lower():
-                        temps['CPU'] = max(temps['CPU'], temp)
-                    elif 'gpu' in zone_type.lower():
-                        temps['GPU'] = max(temps['GPU'], temp)
-                except (OSError, ValueError):
-                    continue
-        except Exception:
-            logger.debug("Error reading sysfs thermal zones")
+    def _get_block_devices(self) -> List[str]:
+        """Enumerate physical block devices once; the set rarely changes at runtime."""
+        if self._block_devices is None:
+            try:
+                self._block_devices = [
+                    d for d in sorted(os.listdir('/sys/block'))
+                    if not d.startswith(_VIRTUAL_BLOCK_PREFIXES)
+                ]
+            except OSError:
+                self._block_devices = []
+        return self._block_devices
+
+    def _get_storage_hwmon_fds(self) -> List[int]:
+        """Drive hwmon temp inputs, globbed once alongside the block device list and held open."""
+        if self._storage_hwmon_fds is None:
+            self._storage_hwmon_fds = []
+            for device in self._get_block_devices():
+                for temp_input in Path('/sys/block', device, 'device').glob('hwmon*/temp1_input'):
+                    try:
+                        self._storage_hwmon_fds.append(os.open(temp_input, os.O_RDONLY))
+                    except OSError:
+                        continue
+        return self._storage_hwmon_fds
 
-        # Try lm-sensors
+    def _close_storage_hwmon(self):
+        for fd in self._storage_hwmon_fds or ():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._storage_hwmon_fds = None
+
+    def _get_storage_temp(self) -> Optional[float]:
+        """Storage temperature from drive hwmon nodes, else the last background smartctl read."""
+        hwmon_temps: List[float] = []
+        for fd in self._get_storage_hwmon_fds():
+            try:
+                hwmon_temps.append(int(os.pread(fd, 16, 0)) / 1000.0)
+            except (OSError, ValueError):
+                continue
+        if hwmon_temps:
+            return max(hwmon_temps)
+
+        # SMART reads stall the I/O queue and can wake sleeping disks, and smartctl
+        # can take seconds per device: refresh on a worker, return the cached value
+        now = time.monotonic()
+        if now - self._last_smart_ts >= self.SMART_INTERVAL and not (
+                self._smart_thread is not None and self._smart_thread.is_alive()):
+            self._last_smart_ts = now
+            self._smart_thread = threading.Thread(
+                target=self._refresh_smart_temp, name="guro-smart", daemon=True)
+            self._smart_thread.start()
+        return self._smart_temp
+
+    def _refresh_smart_temp(self):
+        self._smart_temp = self._read_smart_temp()
+
+    def _read_smart_temp(self) -> Optional[float]:
+        for device in self._get_block_devices():
+            smart_path = Path(f'/dev/{device}')
+            if not smart_path.exists():
+                continue
+            try:
+                smart_output = subprocess.check_output(
+                    ['smartctl', '-A', '-n', 'standby', str(smart_path)],
+                    stderr=subprocess.DEVNULL,
+                    timeout=SUBPROCESS_TIMEOUT,
+                )
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+                continue
+            except Exception:
+                logger.debug("smartctl not available")
+                return None
+            # Scanned as bytes: float() parses ASCII digits, so nothing is decoded
+            storage_temp = None
+            for line in smart_output.splitlines():
+                if b'Temperature' in line or b'temp' in line.lower():
+                    # The temperature value is typically the last numeric field
+                    for part in reversed(line.split()):
+                        try:
+                            value = float(part)
+                        except ValueError:
+                            continue
+                        if 0 < value < 120:  # sanity check
+                            storage_temp = value if storage_temp is None else max(storage_temp, value)
+                            break
+            return storage_temp  # Found one device with SMART data, that's enough
+        return None
+
+    def _read_lm_sensors(self) -> List[Tuple[str, str, float]]:
+        """Last-resort fallback: parse `sensors` output into (chip, label, °C) readings."""
+        readings: List[Tuple[str, str, float]] = []
         try:
             sensors_output = subprocess.check_output(
                 ['sensors'],
                 stderr=subprocess.DEVNULL,
                 timeout=SUBPROCESS_TIMEOUT,
             ).decode()
-            gpu_temps: List[float] = []
             current_device = ""
             for line in sensors_output.split('\n'):
                 line = line.strip()
@@ -148,21 +629,10 @@ class SystemHeatmap:
                     continue
 
                 name, value = line.split(':', 1)
-                name = name.lower()
-
                 if '°C' in value:
                     temp = self._parse_sensor_temp(value)
-                    if temp is None:
-                        continue
-
-                    if any(k in name for k in ['cpu', 'package', 'core', 'tdie', 'tctl']):
-                        temps['CPU'] = max(temps['CPU'], temp)
-                    elif any(k in name for k in ['gpu', 'edge', 'junction', 'mem']) or 'gpu' in current_device:
-                        gpu_temps.append(temp)
-                    elif any(k in name for k in ['mb', 'board', 'systin', 'cputin']):
-                        temps['Motherboard'] = max(temps['Motherboard'], temp)
-            if gpu_temps:
-                temps['GPU'] = max(gpu_temps)
+                    if temp is not None:
+                        readings.append((current_device, name, temp))
         except FileNotFoundError:
             logger.debug("lm-sensors not found, skipping")
         except subprocess.TimeoutExpired:
@@ -171,74 +641,55 @@ class SystemHeatmap:
             logger.debug("sensors command failed, skipping")
         except Exception:
             logger.exception("Unexpected error reading lm-sensors")
-
-        # Try smartctl for storage temperature — discover devices dynamically
-        try:
-            block_devices = os.listdir('/sys/block/')
-            for device in block_devices:
-                smart_path = Path(f'/dev/{device}')
-                if not smart_path.exists():
-                    continue
-                try:
-                    smart_output = subprocess.check_output(
-                        ['smartctl', '-A', str(smart_path)],
-                        stderr=subprocess.DEVNULL,
-                        timeout=SUBPROCESS_TIMEOUT,
-                    ).decode()
-                    for line in smart_output.split('\n'):
-                        if 'Temperature' in line or 'temp' in line.lower():
-                            parts = line.split()
-                            # The temperature value is typically the last numeric field
-                            for part in reversed(parts):
-                                try:
-                                    storage_temp = float(part)
-                                    if 0 < storage_temp < 120:  # sanity check
-                                        temps['Storage'] = max(temps['Storage'], storage_temp)
-                                        break
-                                except ValueError:
-                                    continue
-                    break  # Found one device with temp data, that's enough
-                except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                    continue
-        except Exception:
-            logger.debug("smartctl not available or no block devices found")
-
-        temps['RAM'] = self.get_ram_temp()
-        return temps
+        return readings
 
     @staticmethod
     def _parse_sensor_temp(value: str) -> Optional[float]:
         """Extract temperature from lm-sensors output like '+45.0°C' or 'high = +80.0°C'."""
-        try:
-            clean_val = value.split('°C')[0].strip()
-            # Find start of number
-            start_idx = 0
-            for k, char in enumerate(clean_val):
-                if char.isdigit() or char in '+-.':
-                    start_idx = k
-                    break
-            numeric_str = ''.join(c for c in clean_val[start_idx:] if c.isdigit() or c == '.' or c == '-')
-            if not numeric_str:
-                return None
-            return float(numeric_str)
-        except (ValueError, IndexError):
-            return None
-
-    def get_macos_temps(self) -> Dict[str, float]:
-        temps = self.get_fallback_temps()
+        match = _TEMP_RE.search(value)
+        return float(match.group(1)) if match else None
+
+    def get_macos_temps(self, sample: Optional[Sample] = None) -> Dict[str, float]:
+        if sample is None:
+            sample = Sample.take()
+        temps = self.get_fallback_temps(sample)
+
+        # Both probes are subprocesses (powermetrics alone samples for a second);
+        # run them side by side so a read costs the slower one, not the sum
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='guro-probe')
+            # Callers that never run() or close() still release the workers
+            weakref.finalize(self, self._io_pool.shutdown, wait=False)
+        powermetrics = self._io_pool.submit(self._read_powermetrics)
+        profiler_cpu = self._io_pool.submit(self._read_system_profiler_cpu)
+
+        cpu_temp, gpu_temps = powermetrics.result()
+        if cpu_temp is not None:
+            temps['CPU'] = cpu_temp
+        if gpu_temps:
+            temps['GPU'] = max(gpu_temps)
+        # system_profiler's reading takes precedence when present
+        cpu_temp = profiler_cpu.result()
+        if cpu_temp is not None:
+            temps['CPU'] = cpu_temp
+
+        temps['RAM'] = self.get_ram_temp(sample)
+        return temps
 
-        # Try powermetrics — requires sudo on macOS
+    def _read_powermetrics(self) -> Tuple[Optional[float], List[float]]:
+        """CPU and GPU die temperatures from powermetrics — requires sudo on macOS."""
+        cpu_temp: Optional[float] = None
+        gpu_temps: List[float] = []
         try:
             output = subprocess.check_output(
                 ['sudo', 'powermetrics', '-n', '1', '-i', '1000'],
                 stderr=subprocess.DEVNULL,
                 timeout=SUBPROCESS_TIMEOUT,
             ).decode()
-            gpu_temps: List[float] = []
             for line in output.split('\n'):
                 if 'CPU die temperature' in line:
                     try:
-                        temps['CPU'] = float(line.split(':')[1].split()[0])
+                        cpu_temp = float(line.split(':')[1].split()[0])
                     except (ValueError, IndexError):
                         pass
                 elif 'GPU die temperature' in line:
@@ -246,15 +697,16 @@ class SystemHeatmap:
                         gpu_temps.append(float(line.split(':')[1].split()[0]))
                     except (ValueError, IndexError):
                         pass
-            if gpu_temps:
-                temps['GPU'] = max(gpu_temps)
         except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
             logger.debug("powermetrics not available (requires sudo on macOS)")
             logger.info("Tip: Run with sudo for accurate macOS temperature readings")
         except Exception:
             logger.exception("Unexpected error reading macOS temperatures")
+        return cpu_temp, gpu_temps
 
-        # Try system_profiler (no sudo needed)
+    def _read_system_profiler_cpu(self) -> Optional[float]:
+        """Processor temperature from system_profiler (no sudo needed)."""
+        cpu_temp: Optional[float] = None
         try:
             output = subprocess.check_output(
                 ['system_profiler', 'SPHardwareDataType'],
@@ -264,74 +716,76 @@ class SystemHeatmap:
             for line in output.split('\n'):
                 if 'Processor Temperature' in line:
                     try:
-                        temps['CPU'] = float(line.split(':')[1].strip().replace('°C', ''))
+                        cpu_temp = float(line.split(':')[1].strip().replace('°C', ''))
                     except (ValueError, IndexError):
                         pass
         except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
             logger.debug("system_profiler not available")
         except Exception:
             logger.exception("Unexpected error reading macOS hardware info")
+        return cpu_temp
 
-        temps['RAM'] = self.get_ram_temp()
-        return temps
-
-    def get_ram_temp(self) -> float:
+    def get_ram_temp(self, sample: Optional[Sample] = None) -> float:
         """Estimate RAM temperature based on memory usage."""
-        memory = psutil.virtual_memory()
+        memory = sample.memory if sample is not None else psutil.virtual_memory()
         # Higher memory usage generally correlates with higher temperature
         base_temp = 30.0
         max_temp_increase = 30.0
         return base_temp + (memory.percent / 100.0) * max_temp_increase
 
-    def get_fallback_temps(self) -> Dict[str, float]:
-        cpu_percent = float(psutil.cpu_percent())
-        memory_percent = float(psutil.virtual_memory().percent)
+    def get_fallback_temps(self, sample: Optional[Sample] = None) -> Dict[str, float]:
+        if sample is None:
+            sample = Sample.take()
+        cpu_percent = sample.cpu_percent
+        memory_percent = float(sample.memory.percent)
 
         # Temperature estimates based on system load
-        base_temps: Dict[str, float] = {
-            'CPU': 35.0,
-            'GPU': 35.0,
-            'Motherboard': 30.0,
-            'Storage': 25.0,
-            'RAM': 30.0
+        temps = {
+            component: base + cpu_percent * slope
+            for component, base, slope in _CPU_LOAD_TEMP_MODEL
         }
+        temps['RAM'] = _RAM_BASE_TEMP + memory_percent * _RAM_TEMP_SLOPE
+        return temps
 
-        return {
-            'CPU': base_temps['CPU'] + (cpu_percent * 0.5),
-            'GPU': base_temps['GPU'] + (cpu_percent * 0.4),
-            'Motherboard': base_temps['Motherboard'] + (cpu_percent * 0.2),
-            'Storage': base_temps['Storage'] + (cpu_percent * 0.15),
-            'RAM': base_temps['RAM'] + (memory_percent * 0.3)
-        }
+    def get_system_temps(self, max_age: float = 0.0) -> Dict[str, float]:
+        """Read all component temps from one psutil Sample; readings younger than max_age are reused."""
+        now = time.monotonic()
+        if self._last_temps is not None and now - self._last_temps_ts < max_age:
+            return dict(self._last_temps)
 
-    def get_system_temps(self) -> Dict[str, float]:
-        if self.system == "Windows":
-            return self.get_windows_temps()
-        elif self.system == "Linux":
-            return self.get_linux_temps()
-        elif self.system == "Darwin":
-            return self.get_macos_temps()
-        return self.get_fallback_temps()
+        temps = self._read_temps(Sample.take())
+        self._last_temps_ts = now
+        self._last_temps = temps
+        return dict(temps)
 
     def get_temp_char(self, temp: float) -> tuple:
-        if temp < 45:
-            return ('·', "green")
-        elif temp < 70:
-            return ('▒', "yellow")
-        else:
-            return ('█', "red")
+        """Scalar (char, color) lookup; generate_system_layout classifies whole grids at once."""
+        if 0 <= temp < 101:
+            return _TEMP_CHAR_LUT[int(temp)]
+        # Below zero, above 100 and NaN: same buckets as np.digitize
+        idx = bisect.bisect_right(_TEMP_THRESHOLDS, temp)
+        return (str(_CHAR_TABLE[idx]), _COLOR_TABLE[idx])
 
     def update_component_map(self, component: str, temp: float):
-        rows, cols = self.components[component]['size']
-        base_temp = float(temp)
-        noise = np.random.normal(0, 2, (rows, cols))
-        self.temp_maps[component] = np.clip(base_temp + noise, 0, 100)
-
-    def run(self, interval: float = 1.0, duration: Optional[int] = None) -> int:
+        noise = self._noise[component]
+        temp_map = self.temp_maps[component]
+        self._rng.standard_normal(dtype=np.float32, out=noise)
+        _fill_noisy_map(temp_map, float(temp), noise)
+
+    def run(self, interval: float = 1.0, duration: Optional[int] = None,
+            refresh_hz: float = 1.0,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = time.sleep) -> int:
+        """Show the dashboard until duration elapses or Ctrl+C; returns the update count.
+
+        clock and sleep pace the loop and can be swapped for a virtual clock.
+        """
         if duration is not None and duration <= 0:
             raise ValueError("Duration must be positive")
         if interval <= 0:
             raise ValueError("Interval must be positive")
+        if refresh_hz <= 0:
+            raise ValueError("Refresh rate must be positive")
 
         self.console.clear()
 
@@ -352,17 +806,31 @@ class SystemHeatmap:
             Layout(name="stats")
         )
 
-        start_time = time.time()
+        # Sensor polling (sysfs, subprocess, WMI) runs off the render loop
+        sampler = BackgroundSampler()
+        sampler.add('temps', self.get_system_temps, interval)
+        sampler.sample_now()
+        sampler.start()
+
+        # Rich redraws at refresh_hz; the layout is only rebuilt once per sample
+        start_time = clock()
+        next_sample = start_time
         update_count = 0
 
+        if self._live is None:
+            self._live = Live(layout, console=self.console, refresh_per_second=refresh_hz, screen=True)
+        else:
+            self._live.refresh_per_second = refresh_hz
+            self._live.update(layout)
+
         try:
-            with Live(layout, refresh_per_second=2, screen=True):
+            with self._live:
                 while True:
-                    elapsed = time.time() - start_time
+                    elapsed = clock() - start_time
                     if duration and elapsed >= duration:
                         break
 
-                    temps = self.get_system_temps()
+                    temps = sampler.get('temps')
                     self.temp_history['CPU'].add_point(temps['CPU'])
                     self.temp_history['GPU'].add_point(temps['GPU'])
 
@@ -386,14 +854,7 @@ class SystemHeatmap:
                         title="GPU Thermal Trend", border_style="magenta"
                     ))
 
-                    stats_table = Table(box=box.SIMPLE, expand=True)
-                    stats_table.add_column("Component", style="cyan")
-                    stats_table.add_column("Temp", style="yellow")
-                    for comp, val in temps.items():
-                        color = "green" if val < 45 else "yellow" if val < 70 else "red"
-                        stats_table.add_row(comp, f"[{color}]{val:.1f}°C[/{color}]")
-
-                    layout["stats"].update(Panel(stats_table, title="Current Temps", border_style="white"))
+                    layout["stats"].update(self._build_stats_panel(temps))
 
                     layout["footer"].update(Panel(
                         "[bold yellow]Press Ctrl + C to stop thermal monitoring[/bold yellow]",
@@ -402,48 +863,108 @@ class SystemHeatmap:
                     ))
 
                     update_count += 1
-                    time.sleep(interval)
+                    next_sample = max(next_sample + interval, clock())
+                    sleep(max(0.0, next_sample - clock()))
         except KeyboardInterrupt:
             pass
+        finally:
+            # A probe still blocked in a sensors or smartctl call may yet pread the
+            # held fds or submit to the probe pool, so those stay open for it.
+            if sampler.stop():
+                self.close()
+            else:
+                logger.debug("Temperature probe still running; leaving sensor files open")
 
         return update_count
 
+    def close(self):
+        """Release held sensor files and the probe pool; later reads reopen what they need."""
+        self._thermal_zones.close()
+        self._sensors_backend.close()
+        self._close_storage_hwmon()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+
+    @staticmethod
+    def _build_stats_panel(temps: Dict[str, float]) -> Panel:
+        """Current Temps panel: one row per component, colored by temperature band."""
+        table = Table(box=box.SIMPLE, expand=True)
+        table.add_column("Component", style="cyan")
+        table.add_column("Temp", style="yellow")
+        for comp, val in temps.items():
+            color = _COLOR_TABLE[bisect.bisect_right(_TEMP_THRESHOLDS, val)]
+            table.add_row(comp, f"[{color}]{val:.1f}°C[/{color}]")
+        return Panel(table, title="Current Temps", border_style="white")
+
+    def _render_row(self, row: int, line: str, row_styles: np.ndarray) -> List[Span]:
+        """Style spans for one grid row, one per run of equal style.
+
+        Spans are positioned where the row sits in the frame text. Rows whose
+        characters and styles are unchanged since the previous frame reuse the
+        spans built then.
+        """
+        key = (line, row_styles.tobytes())
+        cached = self._row_cache.get(row)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Run boundaries come from one vectorized compare; each run is just a
+        # span over the row string
+        offset = row * (LAYOUT_COLS + 1)
+        bounds = (np.flatnonzero(row_styles[1:] != row_styles[:-1]) + 1).tolist()
+        starts = [0] + bounds
+        ends = bounds + [len(line)]
+        spans = [
+            Span(offset + start, offset + end, _CELL_STYLES[style])
+            for start, end, style in zip(starts, ends, row_styles[starts].tolist())
+            if _CELL_STYLES[style] is not None
+        ]
+        self._row_cache[row] = (key, spans)
+        return spans
+
     def generate_system_layout(self, temps: Optional[Dict[str, float]] = None) -> Panel:
         if temps is None:
-            temps = self.get_system_temps()
+            temps = self.get_system_temps(max_age=self.TEMPS_MAX_AGE)
+
+        chars = np.full((LAYOUT_ROWS, LAYOUT_COLS), ' ', dtype='<U1')
+        styles = np.zeros((LAYOUT_ROWS, LAYOUT_COLS), dtype=np.uint8)
 
-        layout = [[' ' for _ in range(40)] for _ in range(25)]
-        colors = [[None for _ in range(40)] for _ in range(25)]
+        # All component maps are refilled together over the shared flat buffer
+        self._component_temps[:] = [temps[component] for component in self.components]
+        np.take(self._component_temps, self._cell_component, out=self._cell_temps)
+        self._rng.standard_normal(dtype=np.float32, out=self._noise_flat)
+        _fill_noisy_maps(self._temps_flat, self._cell_temps, self._noise_flat)
 
         for component, info in self.components.items():
             pos_x, pos_y = info['position']
             size_x, size_y = info['size']
 
-            self.update_component_map(component, temps[component])
-
-            for i in range(size_x):
-                for j in range(size_y):
-                    temp = float(self.temp_maps[component][i, j])
-                    char, color = self.get_temp_char(temp)
-                    layout[pos_x + i][pos_y + j] = char
-                    colors[pos_x + i][pos_y + j] = color
+            idx = np.digitize(self.temp_maps[component], _TEMP_BINS)
+            chars[pos_x:pos_x + size_x, pos_y:pos_y + size_y] = _CHAR_TABLE[idx]
+            styles[pos_x:pos_x + size_x, pos_y:pos_y + size_y] = idx + 1
 
             label_x = pos_x + size_x // 2
             label_y = pos_y + size_y // 2
-            label = f"{component[:3]} {temps[component]:.1f}°C"
-            for idx, char in enumerate(label):
-                if 0 <= label_y + idx < len(layout[0]):
-                    layout[label_x][label_y + idx] = char
-                    colors[label_x][label_y + idx] = "white"
-
-        text = Text()
-        for row in range(len(layout)):
-            for col in range(len(layout[0])):
-                text.append(layout[row][col], style=colors[row][col])
-            text.append("\n")
-
-        return Panel(
-            text,
-            title="Internal Thermal Map",
-            border_style="blue"
+            label = f"{component[:3]} {temps[component]:.1f}°C"[:max(0, LAYOUT_COLS - label_y)]
+            chars[label_x, label_y:label_y + len(label)] = list(label)
+            styles[label_x, label_y:label_y + len(label)] = _LABEL_STYLE
+
+        # Each '<U1' row reinterpreted as one '<U{cols}' string: every row's str
+        # comes out of a single tolist() instead of a join per row
+        lines = chars.view(_ROW_DTYPE)[:, 0].tolist()
+
+        # One string for every row and one span list, rather than a Text per row
+        # appended together. The finished Text goes into the Panel with a single
+        # assignment, so Live's refresh thread draws either the previous frame or
+        # this one, never the new string under the old spans.
+        self._layout_panel.renderable = Text(
+            "\n".join(lines) + "\n",
+            spans=[
+                span
+                for row, (line, row_styles) in enumerate(zip(lines, styles))
+                for span in self._render_row(row, line, row_styles)
+            ],
         )
+
+        return self._layout_panel
@@ -1,12 +1,19 @@
 import psutil
 import platform
+import atexit
 import datetime
 import os
 import time
 import csv
 import logging
 import subprocess
-from typing import Dict, List, Optional
+import functools
+import heapq
+import shlex
+import weakref
+from collections import deque
+from operator import itemgetter
+from typing import IO, Callable, Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.table import Table
@@ -15,11 +22,25 @@ from rich.layout import Layout
 from rich.live import Live
 from rich import box
 
-from .utils import ASCIIGraph
+from .utils import ASCIIGraph, BackgroundSampler, Sample, SeriesFlusher, system_facts
+
+try:
+    import pynvml  # provided by the optional nvidia-ml-py package
+    HAS_NVML = True
+except ImportError:
+    pynvml = None
+    HAS_NVML = False
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM = platform.system()
 SUBPROCESS_TIMEOUT = 5  # seconds
+CPU_THERMAL_ZONE = '/sys/class/thermal/thermal_zone0/temp'
+LSPCI_TIMEOUT = 2  # lspci only reads sysfs/pci.ids, anything slower is a hang
+EXPORT_FIELDS = ['timestamp', 'cpu_usage', 'memory_usage']
+EXPORT_BUFFER_SIZE = 64 * 1024
+EXPORT_FLUSH_INTERVAL = 5.0  # seconds between background CSV flushes
+EXPORT_QUEUE_MAXLEN = 3600  # rows held in memory between flushes
 
 
 def _safe_float(val: str) -> Optional[float]:
@@ -35,7 +56,130 @@ def _safe_float(val: str) -> Optional[float]:
         return None
 
 
+# Fields re-read for known NVIDIA GPUs, by both the one-shot and the looping query
+_NVIDIA_DYNAMIC_QUERY = ("--query-gpu=temperature.gpu,utilization.gpu,memory.used,"
+                         "fan.speed,power.draw")
+
+# (key, scale) per numeric nvidia-smi column, in query order; MiB columns scale to bytes
+_MIB = 1024 ** 2
+_NVIDIA_INFO_FIELDS = (
+    ('memory_total', _MIB), ('memory_used', _MIB), ('memory_free', _MIB),
+    ('temperature', 1), ('utilization', 1), ('fan_speed', 1), ('power_draw', 1),
+)
+_NVIDIA_DYNAMIC_FIELDS = (
+    ('temperature', 1), ('utilization', 1), ('memory_used', _MIB),
+    ('fan_speed', 1), ('power_draw', 1),
+)
+
+
+def _nvidia_row(row: List[str], fields: Tuple[Tuple[str, int], ...]) -> Dict:
+    """Typed values for one csv row of nvidia-smi output ([N/A] and friends become None)."""
+    values: Dict = {}
+    for (key, scale), raw in zip(fields, row):
+        value = _safe_float(raw)
+        values[key] = value * scale if value is not None else None
+    values['utilization'] = values['utilization'] or 0.0
+    return values
+
+
+class _NvidiaSmiLoop:
+    """One long-lived `nvidia-smi -lms` process instead of a fork/exec per refresh.
+
+    nvidia-smi prints one row per GPU every period; read() drains the pipe without
+    blocking and returns the newest complete block of rows.
+    """
+
+    def __init__(self, gpu_count: int, period_ms: int):
+        self.gpu_count = gpu_count
+        self._proc = subprocess.Popen(
+            ["nvidia-smi", _NVIDIA_DYNAMIC_QUERY, "--format=csv,noheader,nounits",
+             "-lms", str(period_ms)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._fd = self._proc.stdout.fileno()
+        os.set_blocking(self._fd, False)
+        self._partial = b''
+        self._block: List[str] = []
+        self._rows: List[str] = []
+
+    def read(self) -> Optional[List[str]]:
+        """Newest rows ([] until the first block arrives), or None once nvidia-smi has exited."""
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                self.close()
+                return None
+            chunks.append(chunk)
+        if chunks:
+            lines = (self._partial + b''.join(chunks)).split(b'\n')
+            self._partial = lines.pop()
+            for line in lines:
+                if not line.strip():
+                    continue
+                # Rows arrive GPU 0..n-1 per period, so counting keeps blocks aligned
+                self._block.append(line.decode('utf-8'))
+                if len(self._block) == self.gpu_count:
+                    self._rows, self._block = self._block, []
+        return self._rows
+
+    def close(self):
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=SUBPROCESS_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+        self._proc.stdout.close()
+
+
+# PCI display classes 0300, 0302 and 0380 as named by `lspci -mm`
+_DISPLAY_PCI_CLASSES = frozenset({
+    'VGA compatible controller', '3D controller', 'Display controller',
+})
+_DISPLAY_PCI_MARKERS = tuple(f' "{c}" ' for c in _DISPLAY_PCI_CLASSES)
+
+
 class GPUDetector:
+    # get_all_gpus() forks nvidia-smi / rocm-smi / lspci, so results are
+    # reused for CACHE_TTL seconds instead of being re-queried every frame.
+    CACHE_TTL = 2.0
+    _cache: Dict = {'ts': 0.0, 'data': None}
+    # Static NVIDIA fields (name, memory.total) never change at runtime;
+    # after the first full query only the dynamic fields are re-read.
+    _nvidia_static: Optional[List[Dict]] = None
+    # NVML device handles, opened once; _nvml_failed stops retrying nvmlInit.
+    _nvml_handles: Optional[List] = None
+    _nvml_failed = False
+    # Looping nvidia-smi for the dynamic refresh; never on Windows, whose pipes
+    # cannot be made non-blocking. _nvidia_loop_failed stops respawning it.
+    _nvidia_loop: Optional[_NvidiaSmiLoop] = None
+    _nvidia_loop_failed = _SYSTEM == "Windows"
+
+    @staticmethod
+    def clear_cache():
+        """Drop cached GPU info so the next get_all_gpus() re-queries.
+
+        The looping nvidia-smi is stopped too (and may be started again), so no
+        later refresh reads rows from before the clear.
+        """
+        GPUDetector._cache = {'ts': 0.0, 'data': None}
+        GPUDetector._nvidia_static = None
+        GPUDetector.get_integrated_info.cache_clear()
+        GPUDetector.close()
+        GPUDetector._nvidia_loop_failed = _SYSTEM == "Windows"
+
+    @staticmethod
+    def close():
+        """Stop the looping nvidia-smi, if running. Also registered with atexit."""
+        if GPUDetector._nvidia_loop is not None:
+            GPUDetector._nvidia_loop.close()
+            GPUDetector._nvidia_loop = None
+
     @staticmethod
     def get_nvidia_info() -> List[Dict]:
         try:
@@ -49,26 +193,14 @@ class GPUDetector:
                 universal_newlines=False,
                 timeout=SUBPROCESS_TIMEOUT,
             ).decode('utf-8')
-            lines = output.strip().split('\n')
             gpus = []
-            for line in lines:
-                if not line.strip():
-                    continue
-                parts = [p.strip() for p in line.split(',')]
-                if len(parts) < 8:
+            for row in csv.reader(output.splitlines()):
+                if len(row) < 8:
                     continue
-                name, total, used, free, temp, util, fan, power = parts
-                gpus.append({
-                    'name': name,
-                    'memory_total': _safe_float(total) * (1024**2) if _safe_float(total) is not None else None,
-                    'memory_used': _safe_float(used) * (1024**2) if _safe_float(used) is not None else None,
-                    'memory_free': _safe_float(free) * (1024**2) if _safe_float(free) is not None else None,
-                    'temperature': _safe_float(temp),
-                    'utilization': _safe_float(util) or 0.0,
-                    'fan_speed': _safe_float(fan),
-                    'power_draw': _safe_float(power),
-                    'type': 'NVIDIA'
-                })
+                gpu = {'name': row[0].strip()}
+                gpu.update(_nvidia_row(row[1:], _NVIDIA_INFO_FIELDS))
+                gpu['type'] = 'NVIDIA'
+                gpus.append(gpu)
             return gpus
         except FileNotFoundError:
             logger.debug("nvidia-smi not found, skipping NVIDIA GPU detection")
@@ -83,6 +215,156 @@ class GPUDetector:
             logger.exception("Unexpected error detecting NVIDIA GPUs")
             return []
 
+    @staticmethod
+    def _nvidia_loop_rows(gpu_count: int) -> Optional[List[str]]:
+        """Newest rows from the looping nvidia-smi, started on first use.
+        None when it is unavailable or has not printed a block yet."""
+        loop = GPUDetector._nvidia_loop
+        if loop is not None and loop.gpu_count != gpu_count:
+            loop.close()
+            loop = GPUDetector._nvidia_loop = None
+        if loop is None:
+            if GPUDetector._nvidia_loop_failed:
+                return None
+            try:
+                loop = _NvidiaSmiLoop(gpu_count, int(GPUDetector.CACHE_TTL * 1000))
+            except OSError:
+                logger.debug("Could not start looping nvidia-smi, using one-shot queries")
+                GPUDetector._nvidia_loop_failed = True
+                return None
+            GPUDetector._nvidia_loop = loop
+        rows = loop.read()
+        if rows is None:
+            GPUDetector._nvidia_loop = None
+            GPUDetector._nvidia_loop_failed = True
+        return rows or None
+
+    @staticmethod
+    def get_nvidia_dynamic(static_gpus: List[Dict]) -> List[Dict]:
+        """Refresh only the fields that change at runtime for known NVIDIA GPUs."""
+        rows = GPUDetector._nvidia_loop_rows(len(static_gpus))
+        if rows is not None:
+            return GPUDetector._parse_nvidia_dynamic(static_gpus, rows)
+        try:
+            output = subprocess.check_output(
+                ["nvidia-smi", _NVIDIA_DYNAMIC_QUERY, "--format=csv,noheader,nounits"],
+                universal_newlines=False,
+                timeout=SUBPROCESS_TIMEOUT,
+            ).decode('utf-8')
+        except FileNotFoundError:
+            logger.debug("nvidia-smi not found, skipping NVIDIA GPU refresh")
+            return []
+        except subprocess.TimeoutExpired:
+            logger.warning("nvidia-smi timed out")
+            return []
+        except subprocess.CalledProcessError as e:
+            logger.warning("nvidia-smi failed with return code %d", e.returncode)
+            return []
+        except Exception:
+            logger.exception("Unexpected error refreshing NVIDIA GPUs")
+            return []
+
+        rows = [line for line in output.strip().split('\n') if line.strip()]
+        return GPUDetector._parse_nvidia_dynamic(static_gpus, rows)
+
+    @staticmethod
+    def _parse_nvidia_dynamic(static_gpus: List[Dict], rows: List[str]) -> List[Dict]:
+        if len(rows) != len(static_gpus):
+            # GPU set changed (hot-plug, driver reload) — caller re-queries everything
+            return []
+
+        gpus = []
+        for static, row in zip(static_gpus, csv.reader(rows)):
+            if len(row) < 5:
+                return []
+            gpu = dict(static)
+            gpu.update(_nvidia_row(row, _NVIDIA_DYNAMIC_FIELDS))
+            if gpu.get('memory_total') is not None and gpu['memory_used'] is not None:
+                gpu['memory_free'] = gpu['memory_total'] - gpu['memory_used']
+            gpus.append(gpu)
+        return gpus
+
+    @staticmethod
+    def _nvml_init() -> Optional[List]:
+        """Initialise NVML once and return the device handles, or None when unavailable."""
+        if GPUDetector._nvml_handles is not None:
+            return GPUDetector._nvml_handles
+        if not HAS_NVML or GPUDetector._nvml_failed:
+            return None
+        try:
+            pynvml.nvmlInit()
+            handles = [pynvml.nvmlDeviceGetHandleByIndex(i)
+                       for i in range(pynvml.nvmlDeviceGetCount())]
+        except pynvml.NVMLError as e:
+            logger.debug("NVML unavailable, falling back to nvidia-smi: %s", e)
+            GPUDetector._nvml_failed = True
+            return None
+        atexit.register(GPUDetector._nvml_shutdown)
+        GPUDetector._nvml_handles = handles
+        return handles
+
+    @staticmethod
+    def _nvml_shutdown():
+        try:
+            pynvml.nvmlShutdown()
+        except pynvml.NVMLError:
+            pass
+        GPUDetector._nvml_handles = None
+
+    @staticmethod
+    def _nvml_value(fn, *args):
+        """Call an NVML query, mapping unsupported fields (e.g. fanless cards) to None."""
+        try:
+            return fn(*args)
+        except pynvml.NVMLError:
+            return None
+
+    @staticmethod
+    def get_nvml_info() -> Optional[List[Dict]]:
+        """Query NVIDIA GPUs in-process via NVML. None means use nvidia-smi instead."""
+        handles = GPUDetector._nvml_init()
+        if handles is None:
+            return None
+        value = GPUDetector._nvml_value
+        gpus = []
+        try:
+            for handle in handles:
+                name = pynvml.nvmlDeviceGetName(handle)
+                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                util = value(pynvml.nvmlDeviceGetUtilizationRates, handle)
+                power = value(pynvml.nvmlDeviceGetPowerUsage, handle)
+                gpus.append({
+                    'name': name.decode('utf-8') if isinstance(name, bytes) else name,
+                    'memory_total': float(mem.total),
+                    'memory_used': float(mem.used),
+                    'memory_free': float(mem.free),
+                    'temperature': value(pynvml.nvmlDeviceGetTemperature, handle,
+                                         pynvml.NVML_TEMPERATURE_GPU),
+                    'utilization': float(util.gpu) if util is not None else 0.0,
+                    'fan_speed': value(pynvml.nvmlDeviceGetFanSpeed, handle),
+                    'power_draw': power / 1000.0 if power is not None else None,
+                    'type': 'NVIDIA'
+                })
+        except pynvml.NVMLError:
+            logger.warning("NVML query failed, falling back to nvidia-smi")
+            return None
+        return gpus
+
+    @staticmethod
+    def _get_nvidia_gpus() -> List[Dict]:
+        """NVML when available; otherwise a full nvidia-smi query on first use
+        and a dynamic-only refresh afterwards."""
+        gpus = GPUDetector.get_nvml_info()
+        if gpus is not None:
+            return gpus
+        if GPUDetector._nvidia_static:
+            gpus = GPUDetector.get_nvidia_dynamic(GPUDetector._nvidia_static)
+            if gpus:
+                return gpus
+        gpus = GPUDetector.get_nvidia_info()
+        GPUDetector._nvidia_static = gpus or None
+        return gpus
+
     @staticmethod
     def get_amd_info() -> List[Dict]:
         try:
@@ -136,10 +418,12 @@ class GPUDetector:
             return []
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_integrated_info() -> List[Dict]:
+        """Integrated GPU inventory — fixed after boot, so it is only queried once per process."""
         gpus = []
         try:
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 import wmi  # type: ignore
                 w = wmi.WMI()
                 for video in w.Win32_VideoController():
@@ -151,25 +435,29 @@ class GPUDetector:
                         'utilization': None,
                         'temperature': None
                     })
-            elif platform.system() == "Linux":
+            elif _SYSTEM == "Linux":
                 # Use subprocess without shell=True — no pipe, no injection
                 output = subprocess.check_output(
-                    ["lspci", "-mm"],
+                    ["lspci", "-mm", "-D"],
                     universal_newlines=True,
-                    timeout=SUBPROCESS_TIMEOUT,
+                    timeout=LSPCI_TIMEOUT,
                 )
-                for line in output.strip().split('\n'):
-                    if 'VGA' in line.upper() or '3D' in line.upper() or 'Display' in line.upper():
-                        # Parse device description from lspci -mm output
-                        parts = line.split('\t')
-                        if len(parts) >= 4:
-                            gpus.append({
-                                'name': parts[-1].strip(),
-                                'type': 'Integrated',
-                                'memory_total': None,
-                                'utilization': None,
-                                'temperature': None
-                            })
+                for line in output.splitlines():
+                    # lspci -mm: slot "class" "vendor" "device" [-rXX] [-pXX] "svendor" "sdevice"
+                    if not any(marker in line for marker in _DISPLAY_PCI_MARKERS):
+                        continue
+                    try:
+                        fields = shlex.split(line)
+                    except ValueError:
+                        continue
+                    if len(fields) >= 4 and fields[1] in _DISPLAY_PCI_CLASSES:
+                        gpus.append({
+                            'name': f"{fields[2]} {fields[3]}",
+                            'type': 'Integrated',
+                            'memory_total': None,
+                            'utilization': None,
+                            'temperature': None
+                        })
         except FileNotFoundError:
             logger.debug("lspci not found, skipping integrated GPU detection")
         except subprocess.TimeoutExpired:
@@ -182,12 +470,17 @@ class GPUDetector:
 
     @staticmethod
     def get_all_gpus() -> Dict:
+        now = time.monotonic()
+        cache = GPUDetector._cache
+        if cache['data'] is not None and now - cache['ts'] < GPUDetector.CACHE_TTL:
+            return cache['data']
+
         gpu_info = {
             'available': False,
             'gpus': []
         }
 
-        nvidia_gpus = GPUDetector.get_nvidia_info()
+        nvidia_gpus = GPUDetector._get_nvidia_gpus()
         amd_gpus = GPUDetector.get_amd_info()
         integrated_gpus = GPUDetector.get_integrated_info()
 
@@ -203,51 +496,67 @@ class GPUDetector:
             gpu_info['available'] = True
             gpu_info['gpus'] = all_gpus
 
+        GPUDetector._cache = {'ts': now, 'data': gpu_info}
         return gpu_info
 
 
+atexit.register(GPUDetector.close)
+
+
 class SystemMonitor:
     def __init__(self):
         self.console = Console()
         self.cpu_graph = ASCIIGraph()
         self.memory_graph = ASCIIGraph()
-        self.monitoring_data: List[Dict] = []
-        # Cache GPU info — subprocess calls are expensive
         self._gpu_info = GPUDetector.get_all_gpus()
-        self._gpu_info_time = time.time()
-        self._gpu_info_ttl = 5.0  # Re-query every 5 seconds
+        # psutil.Process objects keep their own cpu_percent deltas between calls
+        self._proc_cache: Dict[int, psutil.Process] = {}
+        # Kept open so each read is a pread() rather than a path lookup + open
+        self._cpu_temp_fd: Optional[int] = None
+        self._cpu_temp_close: Optional[weakref.finalize] = None
+        # The last EXPORT_QUEUE_MAXLEN dashboard rows, for export_monitoring_data()
+        self.monitoring_data: deque = deque(maxlen=EXPORT_QUEUE_MAXLEN)
 
     def _refresh_gpu_info(self) -> Dict:
-        """Return cached GPU info if fresh, otherwise re-query."""
-        now = time.time()
-        if now - self._gpu_info_time > self._gpu_info_ttl:
-            try:
-                self._gpu_info = GPUDetector.get_all_gpus()
-                self._gpu_info_time = now
-            except Exception:
-                logger.exception("Error refreshing GPU info, using cached data")
+        """Return GPU info from the detector's TTL cache, keeping the last good copy on error."""
+        try:
+            self._gpu_info = GPUDetector.get_all_gpus()
+        except Exception:
+            logger.exception("Error refreshing GPU info, using cached data")
         return self._gpu_info
 
     def _get_cpu_temperature(self) -> Optional[float]:
-        if platform.system() == 'Linux':
+        if _SYSTEM == 'Linux':
             try:
-                temp_file = '/sys/class/thermal/thermal_zone0/temp'
-                if os.path.exists(temp_file):
-                    with open(temp_file, 'r') as f:
-                        return float(f.read()) / 1000.0
+                if self._cpu_temp_fd is None:
+                    fd = os.open(CPU_THERMAL_ZONE, os.O_RDONLY)
+                    # Runs from close(), or when the monitor is collected if never closed
+                    self._cpu_temp_close = weakref.finalize(self, os.close, fd)
+                    self._cpu_temp_fd = fd
+                return int(os.pread(self._cpu_temp_fd, 16, 0)) / 1000.0
             except (OSError, ValueError):
                 pass
         return None
 
-    def get_system_info(self) -> Dict:
-        cpu_freq = psutil.cpu_freq()
-        memory = psutil.virtual_memory()
+    def close(self):
+        """Close the held thermal zone fd; the next temperature read reopens it."""
+        if self._cpu_temp_close is not None:
+            self._cpu_temp_close()
+            self._cpu_temp_close = None
+            self._cpu_temp_fd = None
 
+    def get_system_info(self, sample: Optional[Sample] = None) -> Dict:
+        if sample is None:
+            sample = Sample.take(cpu_freq=True)
+        cpu_freq = sample.cpu_freq
+        memory = sample.memory
+
+        facts = system_facts()
         system_info: Dict = {
-            'os': f"{platform.system()} {platform.release()}",
-            'cpu_model': platform.processor(),
-            'cpu_cores': psutil.cpu_count(),
-            'cpu_threads': psutil.cpu_count(logical=True),
+            'os': f"{facts.system} {facts.release}",
+            'cpu_model': facts.processor,
+            'cpu_cores': facts.logical_cores,
+            'cpu_threads': facts.logical_cores,
             'cpu_freq': f"{cpu_freq.current:.2f}MHz" if cpu_freq else "N/A",
             'memory_total': f"{memory.total / (1024**3):.2f}GB",
             'memory_available': f"{memory.available / (1024**3):.2f}GB",
@@ -259,30 +568,45 @@ class SystemMonitor:
 
         return system_info
 
-    def export_monitoring_data(self, filepath: Optional[str] = None):
-        """Export monitoring data to CSV. Uses a timestamped filename by default."""
-        if not self.monitoring_data:
-            return
-
+    def open_export(self, filepath: Optional[str] = None) -> Tuple[IO[str], csv.DictWriter, str]:
+        """Open a CSV export and write its header. Uses a timestamped filename by default."""
         if filepath is None:
             timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             filepath = f'monitoring_data_{timestamp}.csv'
 
-        with open(filepath, 'w', newline='') as csvfile:
-            fieldnames = ['timestamp', 'cpu_usage', 'memory_usage']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        csvfile = open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE)
+        writer = csv.DictWriter(csvfile, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        return csvfile, writer, filepath
 
-            writer.writeheader()
-            for data in self.monitoring_data:
-                writer.writerow(data)
+    def export_monitoring_data(self, filepath: Optional[str] = None):
+        """Export the rows kept in monitoring_data to CSV. Uses a timestamped filename by default.
+
+        Runs with export_data=True already stream every row to disk; this writes
+        the in-memory copy of the most recent ones.
+        """
+        if not self.monitoring_data:
+            return
+
+        csvfile, writer, filepath = self.open_export(filepath)
+        with csvfile:
+            writer.writerows(self.monitoring_data)
 
         self.console.print(f"[green]Monitoring data exported to '{filepath}'[/green]")
 
-    def run_performance_test(self, interval: float = 1.0, duration: Optional[int] = 30, export_data: bool = False):
+    def run_performance_test(self, interval: float = 1.0, duration: Optional[int] = 30,
+                             export_data: bool = False, refresh_hz: float = 1.0,
+                             clock: Callable[[], float] = time.monotonic,
+                             sleep: Callable[[float], None] = time.sleep) -> int:
+        """Show the dashboard until duration elapses or Ctrl+C; returns the update count.
+
+        clock and sleep pace the loop and can be swapped for a virtual clock.
+        """
         self.console.clear()
 
-        # Initial GPU info (subprocess calls)
-        gpu_info = self._refresh_gpu_info()
+        # Size the graphs from the info gathered in __init__; the sampler's
+        # first pass below is the only GPU query before the loop starts.
+        gpu_info = self._gpu_info
         gpu_graphs = [ASCIIGraph(width=40, height=5) for _ in gpu_info.get('gpus', [])]
 
         # Setup Dashboard Layout
@@ -301,31 +625,59 @@ class SystemMonitor:
             Layout(name="mem_graph"),
             Layout(name="gpu_graphs")
         )
+        layout["details"].split_column(
+            Layout(name="gpu_stats"),
+            Layout(name="procs")
+        )
 
-        start_time = time.time()
+        # Each metric is polled on its own cadence by a background thread;
+        # the render loop below only reads the latest values.
+        sampler = BackgroundSampler()
+        sampler.add('sample', lambda: Sample.take(cpu_freq=True), interval)
+        sampler.add('gpu', self._refresh_gpu_info, GPUDetector.CACHE_TTL)
+        sampler.add('procs', self._get_process_table, max(interval, 1.0))
+        sampler.sample_now()
+        sampler.start()
+
+        # Rows queue up here and a background thread streams them to disk, so
+        # memory stays flat and the loop never blocks on a file write. If the
+        # writer stalls, the oldest rows are dropped and reported at the end.
+        flusher: Optional[SeriesFlusher] = None
+        export_path = None
+        dropped = 0
+        if export_data:
+            export_file, export_writer, export_path = self.open_export()
+            flusher = SeriesFlusher(deque(maxlen=EXPORT_QUEUE_MAXLEN), export_file, export_writer,
+                                    EXPORT_FLUSH_INTERVAL, name="guro-monitor-export")
+
+        # Rich redraws at refresh_hz; the layout is only rebuilt once per sample
+        start_time = clock()
+        next_sample = start_time
+        updates = 0
         try:
-            with Live(layout, refresh_per_second=4, screen=True):
+            with Live(layout, refresh_per_second=refresh_hz, screen=True):
                 while True:
-                    current_time = time.time()
-                    elapsed = current_time - start_time
+                    elapsed = clock() - start_time
                     if duration and (elapsed >= duration):
                         break
 
-                    # Update System Stats
-                    cpu_percent = psutil.cpu_percent()
-                    memory = psutil.virtual_memory()
-                    memory_percent = memory.percent
-                    sys_info = self.get_system_info()
+                    # Update System Stats — one psutil sample shared by the whole frame
+                    sample = sampler.get('sample')
+                    cpu_percent = sample.cpu_percent
+                    memory_percent = sample.memory.percent
+                    sys_info = self.get_system_info(sample)
 
                     self.cpu_graph.add_point(cpu_percent)
                     self.memory_graph.add_point(memory_percent)
 
-                    if export_data:
-                        self.monitoring_data.append({
-                            'timestamp': datetime.datetime.now().isoformat(),
-                            'cpu_usage': cpu_percent,
-                            'memory_usage': memory_percent
-                        })
+                    row = {
+                        'timestamp': datetime.datetime.now().isoformat(),
+                        'cpu_usage': cpu_percent,
+                        'memory_usage': memory_percent
+                    }
+                    self.monitoring_data.append(row)
+                    if flusher is not None:
+                        flusher.append(row)
 
                     # Header
                     header_text = (
@@ -349,8 +701,7 @@ class SystemMonitor:
                     layout["cpu_graph"].update(cpu_panel)
                     layout["mem_graph"].update(mem_panel)
 
-                    # Refresh GPU info from cache
-                    gpu_info = self._refresh_gpu_info()
+                    gpu_info = sampler.get('gpu', gpu_info)
                     # Ensure enough graphs if GPU count changed
                     while len(gpu_graphs) < len(gpu_info.get('gpus', [])):
                         gpu_graphs.append(ASCIIGraph(width=40, height=5))
@@ -400,12 +751,10 @@ class SystemMonitor:
                         )
 
                     # Details Column
-                    details_layout = Layout()
-                    details_layout.split_column(
-                        Layout(Panel(gpu_details_table, title="Detailed Stats", border_style="white")),
-                        Layout(Panel(self._get_process_table(), title="Top Processes", border_style="white"))
-                    )
-                    layout["details"].update(details_layout)
+                    layout["gpu_stats"].update(
+                        Panel(gpu_details_table, title="Detailed Stats", border_style="white"))
+                    layout["procs"].update(
+                        Panel(sampler.get('procs'), title="Top Processes", border_style="white"))
 
                     # Footer
                     layout["footer"].update(Panel(
@@ -414,19 +763,31 @@ class SystemMonitor:
                         border_style="blue"
                     ))
 
-                    time.sleep(interval)
+                    updates += 1
+                    next_sample = max(next_sample + interval, clock())
+                    sleep(max(0.0, next_sample - clock()))
 
         except KeyboardInterrupt:
             pass
+        finally:
+            sampler.stop()
+            self.close()
+            if flusher is not None:
+                dropped = flusher.stop()
 
         self.console.clear()
         self.console.print("[bold green]Monitoring completed.[/bold green]")
-        if export_data:
-            self.export_monitoring_data()
+        if dropped:
+            logger.warning("Monitoring export fell behind; %d rows dropped", dropped)
+            self.console.print(f"[yellow]Export fell behind: {dropped} oldest rows were dropped[/yellow]")
+        if export_path is not None:
+            self.console.print(f"[green]Monitoring data exported to '{export_path}'[/green]")
+        return updates
 
     def _get_process_table(self) -> Table:
         """Build a table of top 10 processes by CPU usage.
-        Calls cpu_percent twice with a brief delay for accurate readings."""
+        Process objects are cached across calls, so cpu_percent reports the
+        delta since the previous table without a seeding pass and sleep."""
         table = Table(box=box.SIMPLE, expand=True)
         table.add_column("PID", style="dim")
         table.add_column("Name")
@@ -434,34 +795,33 @@ class SystemMonitor:
         table.add_column("Mem%", justify="right")
 
         try:
-            # First call seeds the counters — discard results
-            procs = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            pids = set(psutil.pids())
+            for pid in self._proc_cache.keys() - pids:
+                del self._proc_cache[pid]
+            for pid in pids - self._proc_cache.keys():
                 try:
-                    proc.cpu_percent(interval=None)  # Seed
+                    proc = psutil.Process(pid)
+                    proc.cpu_percent(interval=None)  # Seed; first reading is always 0.0
+                    self._proc_cache[pid] = proc
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass
 
-            # Brief sleep for delta accumulation
-            time.sleep(0.05)
-
-            # Second call gets meaningful delta values
-            for proc in psutil.process_iter(['pid', 'name', 'memory_percent']):
+            procs = []
+            for pid, proc in list(self._proc_cache.items()):
                 try:
-                    cpu_pct = proc.cpu_percent(interval=None)
-                    mem_pct = proc.info.get('memory_percent', 0.0) or 0.0
-                    procs.append({
-                        'pid': proc.info['pid'],
-                        'name': proc.info['name'] or 'N/A',
-                        'cpu_percent': cpu_pct,
-                        'memory_percent': mem_pct,
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    with proc.oneshot():
+                        procs.append({
+                            'pid': pid,
+                            'name': proc.name() or 'N/A',
+                            'cpu_percent': proc.cpu_percent(interval=None),
+                            'memory_percent': proc.memory_percent() or 0.0,
+                        })
+                except psutil.NoSuchProcess:
+                    del self._proc_cache[pid]
+                except psutil.AccessDenied:
                     pass
 
-            procs.sort(key=lambda x: x['cpu_percent'], reverse=True)
-
-            for proc in procs[:10]:
+            for proc in heapq.nlargest(10, procs, key=itemgetter('cpu_percent')):
                 table.add_row(
                     str(proc['pid']),
                     proc['name'][:15],
@@ -1,11 +1,16 @@
+import os
+import re
 import time
+import contextlib
 import threading
 import platform
 import csv
 import datetime
+import signal
 import socket
-from collections import deque
-from typing import Dict, List, Optional, Tuple
+import weakref
+from collections import deque, namedtuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import psutil
 from rich.console import Console
@@ -17,21 +22,41 @@ from rich.text import Text
 from rich import box
 from rich.align import Align
 
+from .utils import SeriesFlusher
+
 SPARKLINE_CHARS = ' ▁▂▃▄▅▆▇█'
 
+EXPORT_FIELDS = ('timestamp', 'interface', 'upload_bps', 'download_bps')
+SERIES_MAXLEN = 3600      # rows held in memory: export queue and export_csv() history
+FLUSH_INTERVAL = 5.0      # seconds between background CSV flushes
+
 _SYSTEM = platform.system()
 
 
-def _format_bytes(n: float) -> str:
-    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+# Bound str.format methods per unit, built once; speeds are formatted several
+# times per interface per tick. Scaling multiplies by the exact power-of-two
+# reciprocal rather than dividing.
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_BYTES_FORMATS = tuple(f"{{:.1f}} {unit}".format for unit in _BYTE_UNITS)
+_SPEED_FORMATS = tuple(f"{{:.1f}} {unit}/s".format for unit in _BYTE_UNITS)
+_INV_KIB = 1.0 / 1024.0
+
+
+def _format_scaled(n: float, formats) -> str:
+    last = len(formats) - 1
+    for i in range(last):
         if abs(n) < 1024.0:
-            return f"{n:.1f} {unit}"
-        n /= 1024.0
-    return f"{n:.1f} PB"
+            return formats[i](n)
+        n *= _INV_KIB
+    return formats[last](n)
+
+
+def _format_bytes(n: float) -> str:
+    return _format_scaled(n, _BYTES_FORMATS)
 
 
 def _format_speed(n: float) -> str:
-    return _format_bytes(n) + '/s'
+    return _format_scaled(n, _SPEED_FORMATS)
 
 
 def _sparkline(values: List[float], width: int = 20) -> str:
@@ -43,6 +68,64 @@ def _sparkline(values: List[float], width: int = 20) -> str:
     return ''.join(SPARKLINE_CHARS[min(int((v / peak) * max_idx), max_idx)] for v in recent).rjust(width)
 
 
+# The two counters get_speeds() uses, under psutil's snetio field names so
+# either source can be diffed against the other
+_NicBytes = namedtuple('_NicBytes', 'bytes_sent bytes_recv')
+
+
+# After two header lines: "  name: rx_bytes <7 more rx fields> tx_bytes ...".
+# One findall over the whole buffer yields (name, rx_bytes, tx_bytes) per
+# interface, with no per-line split lists; int() accepts the bytes directly.
+_PROC_NET_DEV_RE = re.compile(rb'^\s*([^\s:]+):\s*(\d+)(?:\s+\d+){7}\s+(\d+)', re.MULTILINE)
+
+
+def _parse_proc_net_dev(data: Union[bytes, memoryview]) -> Dict[str, _NicBytes]:
+    """Parse /proc/net/dev into per-interface byte counters."""
+    return {
+        name.decode('ascii', 'replace'): _NicBytes(int(sent), int(recv))
+        for name, recv, sent in _PROC_NET_DEV_RE.findall(data)
+    }
+
+
+class _ProcNetDev:
+    """/proc/net/dev held open and re-read with pread, instead of psutil
+    opening, reading and closing it on every sample."""
+
+    PATH = '/proc/net/dev'
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        # Reused by every read; doubled whenever the file fills it
+        self._buf = bytearray(self.READ_SIZE)
+        weakref.finalize(self, os.close, fd)
+
+    @classmethod
+    def open(cls, path: str = PATH) -> Optional['_ProcNetDev']:
+        if _SYSTEM != 'Linux':
+            return None
+        try:
+            return cls(os.open(path, os.O_RDONLY))
+        except OSError:
+            return None
+
+    def read(self) -> Optional[Dict[str, _NicBytes]]:
+        size = 0
+        try:
+            while True:
+                if size == len(self._buf):
+                    self._buf += bytes(size)
+                with memoryview(self._buf) as view:
+                    n = os.preadv(self._fd, [view[size:]], size)
+                if not n:
+                    break
+                size += n
+        except OSError:
+            return None
+        with memoryview(self._buf) as view:
+            return _parse_proc_net_dev(view[:size])
+
+
 def _get_proc_net_snmp() -> Dict:
     stats = {'tcp': {}, 'udp': {}}
     if _SYSTEM != 'Linux':
@@ -77,15 +160,38 @@ def _get_proc_net_snmp() -> Dict:
     return stats
 
 
+def _default_export_path() -> str:
+    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"network_monitor_{ts}.csv"
+
+
+class _SeriesFlusher(SeriesFlusher):
+    """SeriesFlusher for the network export: opens the file and writes its header."""
+
+    def __init__(self, series: deque, filepath: str, every: float = FLUSH_INTERVAL):
+        csvfile = open(filepath, 'w', newline='', buffering=1 << 16)
+        writer = csv.writer(csvfile)
+        writer.writerow(EXPORT_FIELDS)
+        super().__init__(series, csvfile, writer, every, name="guro-net-export")
+
+
 class NetworkMonitor:
     def __init__(self):
         self._stop_event = threading.Event()
         self._speed_history: Dict[str, deque] = {}
         self._prev_io: Dict = {}
-        self._prev_time = time.time()
-        self._start_time = time.time()
+        self._prev_time = time.monotonic()
+        self._start_time = time.monotonic()
         self._console = Console()
-        self._export_data: List[Dict] = []
+        self._tty = self._console.is_terminal
+        # (timestamp, interface, upload_bps, download_bps) rows awaiting export
+        self._series: deque = deque(maxlen=SERIES_MAXLEN)
+        # The same rows, most recent last, kept for export_csv()
+        self._recent: deque = deque(maxlen=SERIES_MAXLEN)
+        self._proc_net_dev = _ProcNetDev.open()
+        # Text cells of the adapter/history tables that change per tick, by interface
+        self._adapter_cells: Dict[str, Tuple[Text, Text]] = {}
+        self._history_cells: Dict[str, Tuple[Text, Text, Text, Text]] = {}
 
     @property
     def running(self):
@@ -134,23 +240,37 @@ class NetworkMonitor:
     def get_active_interfaces(self) -> List[str]:
         return [i['name'] for i in self.get_interfaces() if i['isup']]
 
-    def get_speeds(self) -> Dict[str, Tuple[float, float]]:
-        current = psutil.net_io_counters(pernic=True)
-        now = time.time()
-        elapsed = now - self._prev_time
-        if elapsed <= 0:
-            elapsed = 0.001
+    def _read_io_counters(self) -> Dict:
+        """Per-NIC counters, from the held-open /proc/net/dev on Linux, else psutil."""
+        if self._proc_net_dev is not None:
+            counters = self._proc_net_dev.read()
+            if counters:
+                return counters
+        return psutil.net_io_counters(pernic=True, nowrap=True)
+
+    def get_speeds(self, now: Optional[float] = None) -> Dict[str, Tuple[float, float]]:
+        """Per-interface (up, down) bytes/s since the previous read; now defaults to time.monotonic()."""
+        current = self._read_io_counters()
+        # Divide by the measured delta, not the nominal interval
+        if now is None:
+            now = time.monotonic()
+        elapsed = max(now - self._prev_time, 0.001)
+        prev_io = self._prev_io
+        history = self._speed_history
         speeds = {}
         for name, io in current.items():
-            if name in self._prev_io:
-                up = (io.bytes_sent - self._prev_io[name].bytes_sent) / elapsed
-                down = (io.bytes_recv - self._prev_io[name].bytes_recv) / elapsed
-                speeds[name] = (max(0, up), max(0, down))
-                if name + '_up' in self._speed_history:
-                    self._speed_history[name + '_up'].append(max(0, up))
-                    self._speed_history[name + '_down'].append(max(0, down))
-            else:
+            prev = prev_io.get(name)
+            if prev is None:
                 speeds[name] = (0.0, 0.0)
+                continue
+            # Clamp once: counters reset when an interface is re-created
+            up = max(0.0, (io.bytes_sent - prev.bytes_sent) / elapsed)
+            down = max(0.0, (io.bytes_recv - prev.bytes_recv) / elapsed)
+            speeds[name] = (up, down)
+            up_history = history.get(name + '_up')
+            if up_history is not None:
+                up_history.append(up)
+                history[name + '_down'].append(down)
         self._prev_io = current
         self._prev_time = now
         return speeds
@@ -206,17 +326,25 @@ class NetworkMonitor:
         table.add_column("↑ Up", width=10)
         table.add_column("↓ Down", width=10)
 
+        self._adapter_cells = {}
         for iface in interfaces:
             name = iface['name']
             status = "[OK]" if iface['isup'] else "[!!]"
             ip = iface['ipv4'][0] if iface['ipv4'] else (iface['ipv6'][0] if iface['ipv6'] else "—")
             speed_str = f"{iface['speed']}M" if iface['speed'] > 0 else "?"
-            up_speed = _format_speed(speeds.get(name, (0, 0))[0])
-            down_speed = _format_speed(speeds.get(name, (0, 0))[1])
-            table.add_row(name, status, ip, speed_str, up_speed, down_speed)
+            cells = self._adapter_cells[name] = (Text(), Text())
+            table.add_row(name, status, ip, speed_str, *cells)
+        self._update_adapters_table(speeds)
 
         return Panel(table, title="[NET] Network Adapters", border_style="blue")
 
+    def _update_adapters_table(self, speeds: Dict):
+        """Rewrite the Up/Down Text cells in place; the other columns never change."""
+        for name, (up_cell, down_cell) in self._adapter_cells.items():
+            up, down = speeds.get(name, (0, 0))
+            up_cell.plain = _format_speed(up)
+            down_cell.plain = _format_speed(down)
+
     def _build_protocol_panel(self, tcp_states: Dict[str, int], proto_stats: Dict) -> Panel:
         content = []
         state_order = ['ESTABLISHED', 'LISTEN', 'TIME_WAIT', 'CLOSE_WAIT',
@@ -273,42 +401,45 @@ class NetworkMonitor:
         table.add_column("sparkline", width=32)
         table.add_column("speed", width=10, justify="right")
 
-        active = [i for i in interfaces if i['isup']]
+        self._history_cells = {}
+        active = [i['name'] for i in interfaces if i['isup']]
         if not active:
             return Panel("No active interfaces", title="Bandwidth History", border_style="blue")
 
-        for iface in active:
-            name = iface['name']
-            up_hist = _sparkline(list(self._speed_history.get(name + '_up', [])), width=30)
-            down_hist = _sparkline(list(self._speed_history.get(name + '_down', [])), width=30)
-            up_speed = _format_speed(speeds.get(name, (0, 0))[0])
-            down_speed = _format_speed(speeds.get(name, (0, 0))[1])
-            table.add_row("↑", name, f"[green]{up_hist}[/green]", up_speed)
-            table.add_row("↓", name, f"[blue]{down_hist}[/blue]", down_speed)
+        for name in active:
+            up_spark, down_spark = Text(style="green"), Text(style="blue")
+            up_speed, down_speed = Text(), Text()
+            self._history_cells[name] = (up_spark, down_spark, up_speed, down_speed)
+            table.add_row("↑", name, up_spark, up_speed)
+            table.add_row("↓", name, down_spark, down_speed)
+        self._update_history_table(speeds)
 
         return Panel(table, title="Bandwidth History (last 60s)", border_style="blue")
 
+    def _update_history_table(self, speeds: Dict):
+        """Rewrite the sparkline and speed Text cells in place, two rows per interface."""
+        for name, (up_spark, down_spark, up_speed, down_speed) in self._history_cells.items():
+            up, down = speeds.get(name, (0, 0))
+            up_spark.plain = _sparkline(list(self._speed_history.get(name + '_up', [])), width=30)
+            down_spark.plain = _sparkline(list(self._speed_history.get(name + '_down', [])), width=30)
+            up_speed.plain = _format_speed(up)
+            down_speed.plain = _format_speed(down)
+
     def export_csv(self, filepath: Optional[str] = None):
-        if not self._export_data:
+        """Write the last SERIES_MAXLEN dashboard rows to CSV, whether or not the run streamed an export."""
+        if not self._recent:
             self._console.print("[yellow]No data to export[/yellow]")
             return
         if not filepath:
-            ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filepath = f"network_monitor_{ts}.csv"
+            filepath = _default_export_path()
         with open(filepath, 'w', newline='') as f:
-            fields = ['timestamp', 'interface', 'upload_bps', 'download_bps']
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            writer.writerows(self._export_data)
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_FIELDS)
+            writer.writerows(self._recent)
         self._console.print(f"[green]Data exported to {filepath}[/green]")
 
-    def run_dashboard(self, interval: float = 1.0,
-                      duration: Optional[int] = None,
-                      export: bool = False):
-        interfaces = self.get_interfaces()
-        active = [i['name'] for i in interfaces if i['isup']]
-        self._ensure_history(active)
-
+    def _dashboard_renderer(self, interfaces: List[Dict]):
+        """Build the dashboard layout once; return it with a per-tick update callback."""
         layout = Layout()
         layout.split(
             Layout(name="header", size=3),
@@ -321,47 +452,136 @@ class NetworkMonitor:
             Layout(name="connections"),
         )
 
-        start = time.time()
+        # Adapter and history tables are built once; each tick only rewrites
+        # the Text objects in their speed/sparkline cells.
+        layout["adapters"].update(self._build_adapters_panel(interfaces, {}))
+        layout["history"].update(self._build_history_panel(interfaces, {}))
+
+        def render(elapsed: float, speeds: Dict):
+            tcp_states = self.get_tcp_states()
+            proto_stats = self.get_protocol_stats()
+            conns = self.get_connections()
+
+            layout["header"].update(self._build_header(elapsed))
+            self._update_adapters_table(speeds)
+            self._update_history_table(speeds)
+            layout["protocols"].update(
+                self._build_protocol_panel(tcp_states, proto_stats))
+            layout["connections"].update(
+                self._build_connections_panel(conns))
+
+        return layout, render
+
+    def _plain_renderer(self, active: List[str]):
+        """Per-tick callback writing one CSV-style line per active interface,
+        for piped/redirected output where a full-screen dashboard is useless."""
+        out = self._console.file
+
+        def render(elapsed: float, speeds: Dict):
+            out.write(''.join(
+                f"{elapsed:.2f},{name},{speeds[name][0]:.2f},{speeds[name][1]:.2f}\n"
+                for name in active if name in speeds
+            ))
+            out.flush()
+
+        return render
+
+    def run_dashboard(self, interval: float = 1.0,
+                      duration: Optional[int] = None,
+                      export: bool = False,
+                      clock: Callable[[], float] = time.monotonic,
+                      wait: Optional[Callable[[float], object]] = None) -> int:
+        """Show the dashboard until duration elapses, stop() or Ctrl+C; returns the tick count.
+
+        clock and wait pace the loop and can be swapped for a virtual clock;
+        wait defaults to the stop event's wait so stopping ends the sleep at once.
+        """
+        if wait is None:
+            wait = self._stop_event.wait
+        interfaces = self.get_interfaces()
+        active = [i['name'] for i in interfaces if i['isup']]
+        self._ensure_history(active)
+
+        # Decided once: the loop below never checks for a terminal again
+        if self._tty:
+            layout, update = self._dashboard_renderer(interfaces)
+            # Redrawn right after each tick has rewritten the cells rather than on
+            # Live's own timer, which would show every sample up to an interval late
+            # and could draw while a tick is halfway through its updates.
+            display = Live(layout, auto_refresh=False, screen=True)
+
+            def render(elapsed: float, speeds: Dict):
+                update(elapsed, speeds)
+                display.refresh()
+        else:
+            render = self._plain_renderer(active)
+            display = contextlib.nullcontext()
+
+        # Ctrl-C only sets the stop event: the loop finishes its tick, wakes from
+        # the wait below and exits through the cleanup. Handlers can only be
+        # installed from the main thread, which is also the only one Ctrl-C reaches.
+        stopped_by_user = False
+
+        def on_sigint(signum, frame):
+            nonlocal stopped_by_user
+            stopped_by_user = True
+            self._stop_event.set()
+
+        start = clock()
+        next_tick = start
+        ticks = 0
+        flusher = None
 
+        previous_sigint = None
+        if threading.current_thread() is threading.main_thread():
+            previous_sigint = signal.signal(signal.SIGINT, on_sigint)
+            if previous_sigint is None:
+                previous_sigint = signal.SIG_DFL
         try:
-            with Live(layout, refresh_per_second=4, screen=True) as live:
-                while self.running:
-                    elapsed = time.time() - start
+            # Opened inside the try so the finally always stops it and closes the file
+            if export:
+                export_path = _default_export_path()
+                flusher = _SeriesFlusher(self._series, export_path)
+
+            with display:
+                while not self._stop_event.is_set():
+                    elapsed = clock() - start
                     if duration and elapsed >= duration:
                         break
 
                     speeds = self.get_speeds()
-                    tcp_states = self.get_tcp_states()
-                    proto_stats = self.get_protocol_stats()
-                    conns = self.get_connections()
-
-                    if export:
-                        for name, (up, down) in speeds.items():
-                            self._export_data.append({
-                                'timestamp': round(elapsed, 2),
-                                'interface': name,
-                                'upload_bps': round(up, 2),
-                                'download_bps': round(down, 2),
-                            })
-
-                    layout["header"].update(self._build_header(elapsed))
-                    layout["adapters"].update(
-                        self._build_adapters_panel(interfaces, speeds))
-                    layout["history"].update(
-                        self._build_history_panel(interfaces, speeds))
-                    layout["protocols"].update(
-                        self._build_protocol_panel(tcp_states, proto_stats))
-                    layout["connections"].update(
-                        self._build_connections_panel(conns))
-
-                    time.sleep(interval)
-
-        except KeyboardInterrupt:
-            pass
+
+                    ts = round(elapsed, 2)
+                    rows = [
+                        (ts, name, round(up, 2), round(down, 2))
+                        for name, (up, down) in speeds.items()
+                    ]
+                    self._recent.extend(rows)
+                    if flusher is not None:
+                        flusher.extend(rows)
+
+                    render(elapsed, speeds)
+                    ticks += 1
+
+                    # Sleep to the next tick so the cadence does not drift by the work
+                    # time; if a tick overran, restart the schedule instead of bursting.
+                    next_tick = max(next_tick + interval, clock())
+                    wait(max(0.0, next_tick - clock()))
+
         finally:
+            if previous_sigint is not None:
+                signal.signal(signal.SIGINT, previous_sigint)
             self.running = False
-            if export:
-                self.export_csv()
+            if stopped_by_user:
+                self._console.print("\n[yellow]Network monitoring stopped by user[/yellow]")
+            if flusher is not None:
+                dropped = flusher.stop()
+                if dropped:
+                    self._console.print(
+                        f"[yellow]Export fell behind: {dropped} oldest rows were dropped[/yellow]"
+                    )
+                self._console.print(f"[green]Data exported to {export_path}[/green]")
+        return ticks
 
     def list_interfaces(self):
         interfaces = self.get_interfaces()
@@ -386,11 +606,13 @@ class NetworkMonitor:
 
         self._console.print(table)
 
-    def show_speed(self):
-        self._prev_io = psutil.net_io_counters(pernic=True)
-        self._prev_time = time.time()
-        time.sleep(1)
-        speeds = self.get_speeds()
+    def show_speed(self, clock: Callable[[], float] = time.monotonic,
+                   wait: Callable[[float], object] = time.sleep):
+        """Print one speed table measured over a one-second window of clock, slept through wait."""
+        self._prev_io = self._read_io_counters()
+        self._prev_time = clock()
+        wait(1)
+        speeds = self.get_speeds(now=clock())
 
         table = Table(title="Current Network Speed", box=box.HEAVY)
         table.add_column("Interface", style="cyan")
@@ -1,37 +1,213 @@
+import functools
+import logging
+import platform
+import threading
+import time
+from dataclasses import dataclass
 from collections import deque
+from typing import IO, Any, Callable, Dict, List, Optional
+
+import numpy as np
+import psutil
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Sample:
+    """psutil readings taken once per tick and shared by everything rendering that tick."""
+    cpu_percent: float
+    memory: Any
+    cpu_freq: Any = None
+
+    @classmethod
+    def take(cls, cpu_freq: bool = False) -> 'Sample':
+        return cls(
+            cpu_percent=float(psutil.cpu_percent()),
+            memory=psutil.virtual_memory(),
+            cpu_freq=psutil.cpu_freq() if cpu_freq else None,
+        )
+
+
+@dataclass(frozen=True)
+class SystemFacts:
+    """Platform and CPU facts that cannot change while the process runs."""
+    system: str
+    release: str
+    processor: str
+    physical_cores: Optional[int]
+    logical_cores: Optional[int]
+
+
+@functools.lru_cache(maxsize=None)
+def system_facts() -> SystemFacts:
+    """Read once per process and shared by every dashboard; platform.processor() may fork."""
+    return SystemFacts(
+        system=platform.system(),
+        release=platform.release(),
+        processor=platform.processor(),
+        physical_cores=psutil.cpu_count(logical=False),
+        logical_cores=psutil.cpu_count(logical=True),
+    )
+
+
+@dataclass
+class _Probe:
+    name: str
+    fn: Callable[[], Any]
+    interval: float
+    next_due: float = 0.0
+
+
+class BackgroundSampler:
+    """Runs slow probes on a daemon thread so the UI loop only reads their latest values.
+
+    Each probe has its own cadence, so a multi-millisecond subprocess or sysfs
+    read never stretches the frame time of the Live display.
+    """
+
+    def __init__(self):
+        self._probes: List[_Probe] = []
+        self._latest: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Any = None
+
+    def add(self, name: str, fn: Callable[[], Any], interval: float):
+        self._probes.append(_Probe(name, fn, interval))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._latest.get(name, default)
+
+    def _run_probe(self, probe: _Probe):
+        try:
+            value = probe.fn()
+        except Exception:
+            logger.exception("Background probe %r failed", probe.name)
+            return
+        with self._lock:
+            self._latest[probe.name] = value
+
+    def sample_now(self):
+        """Run every probe once on the calling thread so the first frame has data."""
+        now = time.monotonic()
+        for probe in self._probes:
+            self._run_probe(probe)
+            probe.next_due = now + probe.interval
+
+    def _loop(self):
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            for probe in self._probes:
+                if now >= probe.next_due:
+                    self._run_probe(probe)
+                    probe.next_due = max(probe.next_due + probe.interval, now)
+            next_due = min((p.next_due for p in self._probes), default=now + 1.0)
+            self._stop_event.wait(max(0.0, next_due - time.monotonic()))
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="guro-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """Stop the thread; False if a probe was still running after timeout seconds."""
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return True
+        thread.join(timeout=timeout)
+        return not thread.is_alive()
+
+
+class SeriesFlusher:
+    """Drains a series deque into a CSV writer on a daemon thread,
+    so export memory stays fixed and the render loop never writes to disk."""
+
+    def __init__(self, series: deque, csvfile: IO[str], writer: Any, every: float,
+                 name: str = "guro-export"):
+        self._series = series
+        self._every = every
+        self._stop_event = threading.Event()
+        self._file = csvfile
+        self._writer = writer
+        # Rows queued through append/extend and rows written out. A bounded
+        # series evicts its oldest rows when the writer falls behind; once
+        # stop() has drained the rest, the difference is exactly those rows.
+        self._queued = 0
+        self._written = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def append(self, row):
+        self._series.append(row)
+        self._queued += 1
+
+    def extend(self, rows: List):
+        self._series.extend(rows)
+        self._queued += len(rows)
+
+    def _drain(self):
+        series = self._series
+        written = 0
+        while series:
+            self._writer.writerow(series.popleft())
+            written += 1
+        self._written += written
+
+    def _run(self):
+        while not self._stop_event.wait(self._every):
+            self._drain()
+
+    def stop(self) -> int:
+        """Flush whatever is left, close the file and return how many rows were dropped."""
+        self._stop_event.set()
+        self._thread.join()
+        self._drain()
+        self._file.close()
+        return self._queued - self._written
 
 
 class ASCIIGraph:
     def __init__(self, width=70, height=10):
         self.width = width
         self.height = height
-        self.data = deque(maxlen=width)
+        # Fixed-size float32 ring buffer; _head is the next slot to write
+        self._buf = np.zeros(width, dtype=np.float32)
+        self._head = 0
+        self._count = 0
         self.chars = ' ▁▂▃▄▅▆▇█'
+        # Upper edges of the equal-width 0-100 buckets; digitize maps a value
+        # straight to its char index, with <0 and >=100 landing on the ends
+        self._bins = np.linspace(0, 100, len(self.chars), dtype=np.float32)[1:]
+        self._char_lut = np.array(list(self.chars))
+        # Frame lines depend only on width, so build them once; the title line
+        # carries live values and is formatted per render
+        self._top_line = "╔" + "═" * (width + 2) + "╗"
+        self._sep_line = "\u2502 " + "\u2500" * width + " \u2502"
+        self._bottom_line = "╚" + "═" * (width + 2) + "╝"
 
     def add_point(self, value):
-        self.data.append(value)
+        self._buf[self._head] = value
+        self._head = (self._head + 1) % self.width
+        if self._count < self.width:
+            self._count += 1
+
+    @property
+    def data(self) -> np.ndarray:
+        """Stored points, oldest first."""
+        if self._count < self.width:
+            return self._buf[:self._count]
+        return np.concatenate((self._buf[self._head:], self._buf[:self._head]))
 
     def render(self, title=""):
-        if not self.data:
+        if not self._count:
             return ""
 
-        # Normalize data (0-100 range for percentages/temps)
-        normalized = []
-        for val in self.data:
-            # Scale 0-100 to index 0-len(chars)-1
-            idx = int((val / 100.0) * (len(self.chars) - 1))
-            normalized.append(max(0, min(len(self.chars) - 1, idx)))
-
-        # Generate graph
-        lines = []
-        lines.append("╔" + "═" * (self.width + 2) + "╗")
-        lines.append("║ " + title.center(self.width) + " ║")
-        lines.append("\u2502 " + "\u2500" * self.width + " \u2502")
-
-        graph_str = ""
-        for val in normalized:
-            graph_str += self.chars[val]
-        lines.append("║ " + graph_str.ljust(self.width) + " ║")
-
-        lines.append("╚" + "═" * (self.width + 2) + "╝")
-        return "\n".join(lines)
+        # The looked-up '<U1' cells read back as one '<U{n}' string, no per-char join
+        cells = self._char_lut[np.digitize(self.data, self._bins)]
+        graph_str = cells.view(np.dtype(('U', cells.size)))[0]
+
+        return (f"{self._top_line}\n║ {title.center(self.width)} ║\n{self._sep_line}\n"
+                f"║ {graph_str.ljust(self.width)} ║\n{self._bottom_line}")
@@ -0,0 +1,39 @@
+"""Lightweight stand-ins shared across test modules."""
+from collections import namedtuple
+from dataclasses import dataclass
+
+# psutil hands back namedtuples; these mirror the fields the code reads
+FakeMemory = namedtuple('FakeMemory', ['total', 'available', 'percent'], defaults=(0, 0, 0.0))
+FakeCPUFreq = namedtuple('FakeCPUFreq', ['current'])
+# WMI rows from LibreHardwareMonitor/OpenHardwareMonitor, as _read_wmi_sensors reads them
+FakeWMISensor = namedtuple('FakeWMISensor', ['Identifier', 'Name', 'Value'])
+
+
+@dataclass(frozen=True)
+class FakeGPU:
+    """Attribute-only stand-in for a GPUtil GPU."""
+    name: str
+    memoryTotal: int
+    driver: str
+    load: float = 0.0
+    memoryUsed: int = 0
+
+
+class FakeClock:
+    """Virtual monotonic clock; sleep() advances it instead of blocking.
+
+    A non-zero step also advances it by that much on every read, for loops
+    that never sleep.
+    """
+
+    def __init__(self, now: float = 0.0, step: float = 0.0):
+        self.now = now
+        self.step = step
+
+    def __call__(self) -> float:
+        now = self.now
+        self.now += self.step
+        return now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
@@ -1,11 +1,14 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import numpy as np
+from unittest.mock import Mock, patch
 import psutil
 import platform
 from rich.console import Console
 from rich.table import Table
 
+from guro.core.benchmark import _gputil
+from guro.core.utils import SystemFacts
+from tests._fakes import FakeClock, FakeGPU, FakeMemory
+
 # Create a mock GPUtil module
 mock_GPUtil = Mock()
 mock_GPUtil.getGPUs = Mock()
@@ -14,54 +17,73 @@ mock_GPUtil.getGPUs = Mock()
 def mock_gputil_env():
     """Fixture to mock GPUtil for all tests"""
     with patch('guro.core.benchmark.HAS_GPU_STATS', True), \
-         patch('guro.core.benchmark.GPUtil', mock_GPUtil):
+         patch('guro.core.benchmark._gputil', return_value=mock_GPUtil):
         yield
 
 
+@pytest.fixture(scope="session")
+def mock_gpu():
+    """One read-only GPUtil GPU stand-in shared by the whole session"""
+    return FakeGPU(name="Test GPU", memoryTotal=8192, driver="123.45", load=0.5, memoryUsed=4096)
+
+
+@pytest.fixture(scope="session")
+def benchmark_cls():
+    from guro.core.benchmark import SafeSystemBenchmark
+    return SafeSystemBenchmark
+
+
+@pytest.fixture(scope="class")
+def shared_benchmark(benchmark_cls):
+    """One instance per test class for the tests that only read from it"""
+    with patch('guro.core.benchmark.HAS_GPU_STATS', False):
+        return benchmark_cls()
+
+
 class TestSafeSystemBenchmark:
     @pytest.fixture
-    def benchmark(self):
-        """Fixture to create a fresh benchmark instance for each test"""
-        from guro.core.benchmark import SafeSystemBenchmark
-        return SafeSystemBenchmark()
+    def benchmark(self, benchmark_cls):
+        """Fresh instance for tests that mutate results, has_gpu or the stop event"""
+        return benchmark_cls()
 
-    def test_initialization(self, benchmark):
+    def test_initialization(self, shared_benchmark):
         """Test proper initialization of benchmark instance"""
-        assert isinstance(benchmark.console, Console)
-        assert isinstance(benchmark.results, dict)
+        assert isinstance(shared_benchmark.console, Console)
+        assert isinstance(shared_benchmark.results, dict)
         # After init, _stop_event is clear (not set), so running == True
-        assert benchmark.running is True
-        assert benchmark.MAX_CPUSAFE <= 100
-        assert benchmark.MAX_MEMORY_USAGE <= 100
-
-    @patch('guro.core.benchmark.HAS_GPU_STATS', True)
-    def test_check_gpu_with_gpu(self, benchmark):
-        """Test GPU detection when GPU is available"""
-        from guro.core.benchmark import GPUtil as test_GPUtil
-        mock_gpu = Mock()
-        mock_gpu.name = "Test GPU"
-        mock_gpu.memoryTotal = 8192
-        mock_gpu.driver = "123.45"
-
-        with patch.object(test_GPUtil, 'getGPUs', return_value=[mock_gpu]):
-            gpu_info = benchmark._check_gpu()
-            assert gpu_info['available']
+        assert shared_benchmark.running is True
+        assert shared_benchmark.MAX_CPUSAFE <= 100
+        assert shared_benchmark.MAX_MEMORY_USAGE <= 100
+
+    @pytest.mark.parametrize("has_gpu", [True, False], ids=["with_gpu", "without_gpu"])
+    def test_check_gpu(self, shared_benchmark, mock_gpu, has_gpu):
+        """Test GPU detection with and without a GPU present"""
+        with patch.object(mock_GPUtil, 'getGPUs', return_value=[mock_gpu] if has_gpu else []):
+            gpu_info = shared_benchmark._check_gpu()
+
+        assert gpu_info['available'] is has_gpu
+        if has_gpu:
             assert len(gpu_info['gpus']) == 1
             assert gpu_info['gpus'][0]['name'] == "Test GPU"
             assert gpu_info['gpus'][0]['memory_total'] == 8192
             assert gpu_info['gpus'][0]['driver_version'] == "123.45"
-
-    def test_check_gpu_without_gpu(self, benchmark):
-        """Test GPU detection when no GPU is available"""
-        from guro.core.benchmark import GPUtil as test_GPUtil
-        with patch.object(test_GPUtil, 'getGPUs', return_value=[]):
-            gpu_info = benchmark._check_gpu()
-            assert not gpu_info['available']
+        else:
             assert gpu_info['gpus'] == []
 
-    def test_get_system_info(self, benchmark):
+    def test_gputil_imported_once(self):
+        """GPUtil is imported lazily and the module is reused afterwards"""
+        _gputil.cache_clear()
+        try:
+            with patch('importlib.import_module', return_value=mock_GPUtil) as mock_import:
+                assert _gputil() is mock_GPUtil
+                assert _gputil() is mock_GPUtil
+            mock_import.assert_called_once_with('GPUtil')
+        finally:
+            _gputil.cache_clear()
+
+    def test_get_system_info(self, shared_benchmark):
         """Test system information gathering"""
-        system_info = benchmark.get_system_info()
+        system_info = shared_benchmark.get_system_info()
 
         assert system_info['system'] == platform.system()
         assert system_info['processor'] == platform.processor()
@@ -69,51 +91,66 @@ class TestSafeSystemBenchmark:
         assert system_info['cpu_threads'] == psutil.cpu_count(logical=True)
         assert isinstance(system_info['gpus'], list)
 
-    @patch('time.sleep', return_value=None)
-    def test_safe_cpu_test(self, mock_sleep, benchmark):
+    def test_get_system_info_from_shared_facts(self, benchmark):
+        """Static fields come from the process-wide system_facts()"""
+        facts = SystemFacts(system='Linux', release='6.1', processor='x86_64',
+                            physical_cores=4, logical_cores=8)
+        with patch('guro.core.benchmark.system_facts', return_value=facts):
+            info = benchmark.get_system_info()
+
+        assert (info['system'], info['processor']) == ('Linux', 'x86_64')
+        assert (info['cpu_cores'], info['cpu_threads']) == (4, 8)
+
+    def test_safe_cpu_test(self, benchmark):
         """Test CPU benchmark functionality"""
-        duration = 0.5
+        # Each clock read moves 0.1s on: two rounds fit in the 0.5s run
+        clock = FakeClock(step=0.1)
         benchmark._stop_event.clear()
-        result = benchmark.safe_cpu_test(duration)
+        result = benchmark.safe_cpu_test(0.5, clock=clock)
 
-        assert 'times' in result
-        assert 'loads' in result
-        assert isinstance(result['times'], list)
-        assert isinstance(result['loads'], list)
+        assert result['times'] == pytest.approx([0.2, 0.4])
+        assert len(result['loads']) == 2
 
-    @patch('time.sleep', return_value=None)
-    def test_safe_memory_test(self, mock_sleep, benchmark):
+    def test_safe_memory_test(self, benchmark):
         """Test memory benchmark functionality"""
-        duration = 0.5
+        clock = FakeClock()
         benchmark._stop_event.clear()
-        result = benchmark.safe_memory_test(duration)
+        with patch('psutil.virtual_memory', return_value=FakeMemory(percent=50.0)):
+            result = benchmark.safe_memory_test(0.3, clock=clock, sleep=clock.sleep)
 
-        assert 'times' in result
-        assert 'usage' in result
-        assert isinstance(result['times'], list)
-        assert isinstance(result['usage'], list)
+        assert result['times'] == pytest.approx([0.0, 0.1, 0.2])
+        assert result['usage'] == [50.0] * 3
 
     @patch('guro.core.benchmark.HAS_GPU_STATS', True)
-    def test_safe_gpu_test_with_gpu(self, benchmark):
+    def test_safe_gpu_test_with_gpu(self, benchmark, mock_gpu):
         """Test GPU benchmark when GPU is available"""
-        from guro.core.benchmark import GPUtil as test_GPUtil
-        duration = 0.5
-
-        mock_gpu = Mock()
-        mock_gpu.load = 0.5
-        mock_gpu.memoryUsed = 4096
-
+        clock = FakeClock()
         benchmark.has_gpu = {'available': True, 'gpus': [{'name': 'Test'}]}
         benchmark._stop_event.clear()
 
-        with patch.object(test_GPUtil, 'getGPUs', return_value=[mock_gpu]):
-            result = benchmark.safe_gpu_test(duration)
+        with patch.object(mock_GPUtil, 'getGPUs', return_value=[mock_gpu]):
+            result = benchmark.safe_gpu_test(0.5, clock=clock, sleep=clock.sleep)
 
-        assert 'times' in result
-        assert 'gpu_stats' in result
-        assert len(result['gpu_stats']) > 0
+        assert len(result['times']) == len(result['gpu_stats']) == 5
         assert result['gpu_stats'][0][0]['load'] == 50.0
 
+    def test_safe_gpu_test_cadence_absorbs_poll_time(self, benchmark, mock_gpu):
+        """Sleeps shrink by the time getGPUs() took, so samples stay POLL_INTERVAL apart"""
+        clock = FakeClock()
+        mock_sleep = Mock(side_effect=clock.sleep)
+
+        def slow_get_gpus():
+            clock.now += 0.03
+            return [mock_gpu]
+
+        benchmark.has_gpu = {'available': True, 'gpus': [{'name': 'Test'}]}
+        with patch.object(mock_GPUtil, 'getGPUs', side_effect=slow_get_gpus):
+            result = benchmark.safe_gpu_test(0.5, clock=clock, sleep=mock_sleep)
+
+        assert len(result['times']) == 5
+        assert all(b - a == pytest.approx(0.1) for a, b in zip(result['times'], result['times'][1:]))
+        assert all(c.args[0] == pytest.approx(0.07) for c in mock_sleep.call_args_list)
+
     @patch('guro.core.benchmark.HAS_GPU_STATS', False)
     def test_safe_gpu_test_without_gpu(self, benchmark):
         """Test GPU benchmark when no GPU is available"""
@@ -129,17 +166,10 @@ class TestSafeSystemBenchmark:
         assert 'gpu_stats' not in result
         assert len(result['times']) == 0
 
-    def test_generate_status_table(self, benchmark):
+    def test_generate_status_table(self, benchmark, mock_gpu):
         """Test status table generation"""
-        from guro.core.benchmark import GPUtil as test_GPUtil
-        mock_gpu = Mock()
-        mock_gpu.name = "Test GPU"
-        mock_gpu.load = 0.5
-        mock_gpu.memoryUsed = 4096
-        mock_gpu.memoryTotal = 8192
-
         benchmark.has_gpu = {'available': True, 'gpus': [{'name': 'Test'}]}
-        with patch.object(test_GPUtil, 'getGPUs', return_value=[mock_gpu]):
+        with patch.object(mock_GPUtil, 'getGPUs', return_value=[mock_gpu]):
             table = benchmark.generate_status_table()
 
             assert isinstance(table, Table)
@@ -160,25 +190,19 @@ class TestSafeSystemBenchmark:
 
         assert benchmark._stop_event.is_set()  # Should have stopped due to high CPU usage
 
+    @pytest.mark.parametrize("run,expected_duration", [
+        ("mini_test", 30),
+        ("god_test", 60),
+    ])
     @patch('rich.live.Live')
-    def test_mini_test(self, mock_live, benchmark):
-        """Test mini benchmark execution"""
-        from guro.core.benchmark import GPUtil as test_GPUtil
-        with patch.object(test_GPUtil, 'getGPUs', return_value=[]):
-            benchmark.mini_test()
-            assert 'system_info' in benchmark.results
-            assert benchmark.results['duration'] == 30
-            assert 'cpu' in benchmark.results
-            assert 'memory' in benchmark.results
-
-    @patch('rich.live.Live')
-    def test_god_test(self, mock_live, benchmark):
-        """Test god-level benchmark execution"""
-        from guro.core.benchmark import GPUtil as test_GPUtil
-        with patch.object(test_GPUtil, 'getGPUs', return_value=[]):
-            benchmark.god_test()
+    def test_benchmark_run(self, mock_live, benchmark, run, expected_duration):
+        """Test mini and god-level benchmark execution"""
+        # One virtual second per clock read keeps both halves to a few rounds
+        clock = FakeClock(step=1.0)
+        with patch.object(mock_GPUtil, 'getGPUs', return_value=[]):
+            getattr(benchmark, run)(clock=clock, sleep=clock.sleep)
             assert 'system_info' in benchmark.results
-            assert benchmark.results['duration'] == 60
+            assert benchmark.results['duration'] == expected_duration
             assert 'cpu' in benchmark.results
             assert 'memory' in benchmark.results
 
@@ -1,15 +1,15 @@
-import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import sys
 import os
 
 # Ensure the src directory is in the path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from guro.core.monitor import GPUDetector, SystemMonitor
+from guro.core.monitor import GPUDetector
 from guro.core.benchmark import SafeSystemBenchmark
 from guro.core.heatmap import SystemHeatmap
 from guro._version import __version__
+from tests._fakes import FakeGPU
 
 
 class TestMultiGPUDetection:
@@ -38,35 +38,32 @@ class TestMultiGPUDetection:
         assert gpus == []
 
 
+# Production code only reads GPU attributes; built once for the module
+MULTI_GPUS = (
+    FakeGPU(name="NVIDIA RTX 4090", memoryTotal=24576, driver="550.0"),
+    FakeGPU(name="NVIDIA RTX 3080", memoryTotal=10240, driver="550.0"),
+)
+
+
 class TestBenchmarkMultiGPU:
     """Tests for benchmark module with multiple GPUs"""
 
-    @patch('guro.core.benchmark.GPUtil')
+    @patch('guro.core.benchmark._gputil')
     @patch('guro.core.benchmark.HAS_GPU_STATS', True)
     def test_benchmark_initialization_multi(self, mock_gputil):
         """Test benchmark initialization detects multiple GPUs."""
-        gpu1 = MagicMock(name="GPU1")
-        gpu1.name = "NVIDIA RTX 4090"
-        gpu1.memoryTotal = 24576
-        gpu1.driver = "550.0"
-
-        gpu2 = MagicMock(name="GPU2")
-        gpu2.name = "NVIDIA RTX 3080"
-        gpu2.memoryTotal = 10240
-        gpu2.driver = "550.0"
-
-        mock_gputil.getGPUs.return_value = [gpu1, gpu2]
+        mock_gputil.return_value.getGPUs.return_value = MULTI_GPUS
 
         benchmark = SafeSystemBenchmark()
         assert benchmark.has_gpu['available'] is True
         assert len(benchmark.has_gpu['gpus']) == 2
         assert benchmark.has_gpu['gpus'][0]['name'] == "NVIDIA RTX 4090"
 
-    @patch('guro.core.benchmark.GPUtil')
+    @patch('guro.core.benchmark._gputil')
     @patch('guro.core.benchmark.HAS_GPU_STATS', True)
     def test_gpu_not_found_status_table(self, mock_gputil):
         """Test status table when no GPU is found."""
-        mock_gputil.getGPUs.return_value = []
+        mock_gputil.return_value.getGPUs.return_value = []
         benchmark = SafeSystemBenchmark()
         benchmark.has_gpu = {'available': False, 'gpus': []}
 
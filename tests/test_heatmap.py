@@ -2,81 +2,168 @@ import pytest
 from unittest.mock import Mock, patch
 import numpy as np
 import platform
-import psutil
 from rich.panel import Panel
 from rich.text import Text
-import time
-import tempfile
-import os
+import threading
+import gc
+import json
 from pathlib import Path
+from types import MappingProxyType
 from rich.console import Console
-from guro.core.heatmap import SystemHeatmap
+from click.testing import CliRunner
+from guro.cli.main import cli
+from guro.core.heatmap import (
+    LAYOUT_COLS, SystemHeatmap, _LhmHttp, _SensorsBackend, _ThermalZones, _classify_sensor,
+)
+from guro.core.utils import Sample
+from tests._fakes import FakeClock, FakeMemory, FakeWMISensor
+
+COMPONENTS = frozenset({'CPU', 'GPU', 'Motherboard', 'RAM', 'Storage'})
+
+# One runner and prebuilt argv for the CLI tests; run() is always mocked there
+_RUNNER = CliRunner()
+_ARGS_INTERVAL = ('heatmap', '--interval', '0.5', '--duration', '2', '--refresh-hz', '2')
+_ARGS_SAMPLE_HZ = ('heatmap', '--sample-hz', '4', '--duration', '1')
+_ARGS_BAD_INTERVAL = ('heatmap', '--interval', '0')
 
 
 @pytest.fixture
 def heatmap():
+    """Fresh instance for tests that touch sensors, caches or the render state"""
+    return SystemHeatmap()
+
+
+@pytest.fixture(scope="module")
+def shared_heatmap():
+    """One instance per module for the tests that only read from it"""
     return SystemHeatmap()
 
 
 @pytest.fixture
+def fake_clock():
+    """Virtual clock for run(): its sleeps advance time instead of blocking"""
+    return FakeClock()
+
+
+@pytest.fixture(scope="module")
 def mock_system_temps():
-    return {
+    """Shared by every test, so read-only: code that mutates it fails loudly"""
+    return MappingProxyType({
         'CPU': 45.0,
         'GPU': 55.0,
         'Motherboard': 40.0,
         'RAM': 35.0,
         'Storage': 30.0
-    }
+    })
 
 
-def test_system_heatmap_initialization(heatmap):
-    assert isinstance(heatmap.console, Console)
-    assert heatmap.history_size == 60
-    assert heatmap.system == platform.system()
-    assert all(component in heatmap.components for component in ['CPU', 'GPU', 'Motherboard', 'RAM', 'Storage'])
+def test_system_heatmap_initialization(shared_heatmap):
+    assert isinstance(shared_heatmap.console, Console)
+    assert shared_heatmap.history_size == 60
+    assert shared_heatmap.system == platform.system()
+    assert shared_heatmap.components.keys() == COMPONENTS
 
 
-@pytest.mark.parametrize("temperature,expected_char,expected_color", [
-    (30.0, '·', "green"),
-    (60.0, '▒', "yellow"),
-    (80.0, '█', "red"),
-    (45.0, '▒', "yellow"),  # Edge case: exactly 45
-    (90.0, '█', "red"),     # Edge case: high temp
-])
-def test_temperature_character_mapping(heatmap, temperature, expected_char, expected_color):
-    char, color = heatmap.get_temp_char(temperature)
-    assert char == expected_char
-    assert color == expected_color
+def test_console_shared_across_instances(shared_heatmap, heatmap):
+    assert heatmap.console is shared_heatmap.console
 
 
-def test_temperature_map_update(heatmap):
-    component = 'CPU'
-    test_temp = 50.0
+# temperature -> (char, colour), including the band edges and out-of-range readings
+TEMP_CHAR_CASES = {
+    30.0: ('·', "green"),
+    60.0: ('▒', "yellow"),
+    80.0: ('█', "red"),
+    45.0: ('▒', "yellow"),  # Edge case: exactly 45
+    90.0: ('█', "red"),     # Edge case: high temp
+    44.99: ('·', "green"),
+    69.99: ('▒', "yellow"),
+    -5.0: ('·', "green"),
+    100.5: ('█', "red"),
+    150.0: ('█', "red"),
+}
 
-    heatmap.update_component_map(component, test_temp)
+
+def test_temperature_character_mapping(shared_heatmap):
+    actual = {temp: shared_heatmap.get_temp_char(temp) for temp in TEMP_CHAR_CASES}
+    assert actual == TEMP_CHAR_CASES
+
+
+def test_temperature_maps_share_one_buffer(heatmap, mock_system_temps):
+    heatmap.generate_system_layout(mock_system_temps)
+
+    assert heatmap.temp_maps.keys() == COMPONENTS
+    for component, temp_map in heatmap.temp_maps.items():
+        assert temp_map.base is heatmap._temps_flat
+        assert temp_map.dtype == heatmap._noise[component].dtype == np.float32
+        assert temp_map.shape == heatmap.components[component]['size']
+        assert np.isclose(temp_map.mean(), mock_system_temps[component], atol=5.0)
+    assert heatmap._temps_flat.size == sum(m.size for m in heatmap.temp_maps.values())
+
+
+@pytest.mark.parametrize("component,test_temp", [('CPU', 50.0), ('GPU', 99.0)])
+def test_temperature_map_update(heatmap, component, test_temp):
+    """Maps are refilled around the reading, reusing their map and noise buffers"""
     temp_map = heatmap.temp_maps[component]
+    noise = heatmap._noise[component]
 
-    expected_shape = heatmap.components[component]['size']
-    assert temp_map.shape == expected_shape
+    heatmap.update_component_map(component, test_temp)
+    heatmap.update_component_map(component, test_temp)
 
-    # Check if the mean temperature is close to the input temperature
+    assert heatmap.temp_maps[component] is temp_map
+    assert heatmap._noise[component] is noise
+    assert temp_map.dtype == np.float32
+    assert temp_map.shape == heatmap.components[component]['size']
     assert np.isclose(np.mean(temp_map), test_temp, atol=5.0)
+    assert temp_map.min() >= 0 and temp_map.max() <= 100
 
 
 @patch('psutil.cpu_percent')
 @patch('psutil.virtual_memory')
 def test_fallback_temperatures(mock_virtual_memory, mock_cpu_percent, heatmap):
     mock_cpu_percent.return_value = 50.0
-    mock_virtual_memory.return_value = Mock(percent=60.0)
+    mock_virtual_memory.return_value = FakeMemory(percent=60.0)
 
     temps = heatmap.get_fallback_temps()
 
     assert isinstance(temps, dict)
-    assert set(temps.keys()) == set(['CPU', 'GPU', 'Motherboard', 'RAM', 'Storage'])
+    assert temps.keys() == COMPONENTS
     assert all(isinstance(temp, float) for temp in temps.values())
     assert all(0 <= temp <= 100 for temp in temps.values())
 
 
+def test_fallback_temps_follow_load(heatmap):
+    sample = Sample(cpu_percent=50.0, memory=FakeMemory(percent=40.0))
+    assert heatmap.get_fallback_temps(sample) == {
+        'CPU': 60.0, 'GPU': 55.0, 'Motherboard': 40.0, 'Storage': 32.5, 'RAM': 42.0,
+    }
+
+
+def test_system_temps_reused_within_max_age(heatmap):
+    with patch('guro.core.heatmap.Sample.take', wraps=Sample.take) as mock_take:
+        first = heatmap.get_system_temps(max_age=60)
+        first['CPU'] = -1.0
+        second = heatmap.get_system_temps(max_age=60)
+        heatmap.get_system_temps()
+
+    assert mock_take.call_count == 2
+    assert second['CPU'] != -1.0
+
+
+@pytest.mark.parametrize("system,reader", [
+    ("Windows", "get_windows_temps"),
+    ("Linux", "get_linux_temps"),
+    ("Darwin", "get_macos_temps"),
+    ("FreeBSD", "get_fallback_temps"),
+])
+def test_system_temps_reader_resolved_once(system, reader):
+    with patch('platform.system', return_value=system), \
+         patch.object(SystemHeatmap, '_setup_windows_api'), \
+         patch.object(SystemHeatmap, reader, return_value={'CPU': 50.0}) as mock_reader:
+        hm = SystemHeatmap()
+        assert hm.get_system_temps() == {'CPU': 50.0}
+    mock_reader.assert_called_once()
+
+
 def test_system_layout_generation(heatmap):
     layout = heatmap.generate_system_layout()
 
@@ -85,28 +172,58 @@ def test_system_layout_generation(heatmap):
     assert isinstance(layout.renderable, Text)
 
 
-def test_heatmap_run_duration(heatmap, mock_system_temps):
+@pytest.mark.timeout(5)
+def test_heatmap_run_duration(heatmap, mock_system_temps, fake_clock):
     """Test heatmap run with mocked system temps and short durations."""
     duration = 2
     interval = 0.5
 
     with patch.object(heatmap, 'get_system_temps', return_value=mock_system_temps), \
          patch('guro.core.heatmap.Live'):
-        update_count = heatmap.run(interval=interval, duration=duration)
+        update_count = heatmap.run(interval=interval, duration=duration,
+                                   clock=fake_clock, sleep=fake_clock.sleep)
+
+    assert update_count == 4
+    assert fake_clock.now == duration
+
+
+@pytest.mark.parametrize("sampler_stopped, closed", [(True, True), (False, False)])
+def test_heatmap_run_closes_only_after_sampler_exits(heatmap, mock_system_temps, fake_clock,
+                                                     sampler_stopped, closed):
+    """Sensor files and the probe pool are left open while a probe may still use them"""
+    with patch.object(heatmap, 'get_system_temps', return_value=mock_system_temps), \
+         patch('guro.core.heatmap.Live'), \
+         patch('guro.core.heatmap.BackgroundSampler.stop', return_value=sampler_stopped), \
+         patch.object(heatmap, 'close') as mock_close:
+        heatmap.run(interval=0.5, duration=1, clock=fake_clock, sleep=fake_clock.sleep)
 
-    assert update_count >= 1
+    assert mock_close.called is closed
 
 
-def test_invalid_inputs(heatmap):
+def test_invalid_inputs(shared_heatmap):
     """Test that invalid inputs raise ValueError."""
     with pytest.raises(ValueError):
-        heatmap.run(interval=0)
+        shared_heatmap.run(interval=0)
+    with pytest.raises(ValueError):
+        shared_heatmap.run(interval=-0.5)
     with pytest.raises(ValueError):
-        heatmap.run(interval=-0.5)
+        shared_heatmap.run(duration=0)
     with pytest.raises(ValueError):
-        heatmap.run(duration=0)
+        shared_heatmap.run(duration=-1)
     with pytest.raises(ValueError):
-        heatmap.run(duration=-1)
+        shared_heatmap.run(refresh_hz=0)
+
+
+@pytest.mark.timeout(5)
+def test_heatmap_run_refresh_rate_decoupled(heatmap, mock_system_temps, fake_clock):
+    """Redraw rate goes to Live; layout updates follow the sampling interval."""
+    with patch.object(heatmap, 'get_system_temps', return_value=mock_system_temps), \
+         patch('guro.core.heatmap.Live') as mock_live:
+        update_count = heatmap.run(interval=0.25, duration=1, refresh_hz=0.5,
+                                   clock=fake_clock, sleep=fake_clock.sleep)
+
+    assert mock_live.call_args.kwargs['refresh_per_second'] == 0.5
+    assert update_count == 4
 
 
 def test_parse_sensor_temp():
@@ -116,3 +233,357 @@ def test_parse_sensor_temp():
     assert SystemHeatmap._parse_sensor_temp('  +72.3°C  ') == 72.3
     assert SystemHeatmap._parse_sensor_temp('N/A') is None
     assert SystemHeatmap._parse_sensor_temp('') is None
+    assert SystemHeatmap._parse_sensor_temp('  +48.0°C  (high = +80.0°C, crit = +100.0°C)') == 48.0
+    assert SystemHeatmap._parse_sensor_temp('-5.5 °C') == -5.5
+
+
+def _make_hwmon(root, index, chip, sensors):
+    hwmon = root / f"hwmon{index}"
+    hwmon.mkdir()
+    (hwmon / "name").write_text(chip + "\n")
+    for n, (label, millideg) in enumerate(sensors, start=1):
+        (hwmon / f"temp{n}_input").write_text(f"{millideg}\n")
+        if label is not None:
+            (hwmon / f"temp{n}_label").write_text(label + "\n")
+
+
+def test_sensors_backend_reads_hwmon(tmp_path):
+    """hwmon inputs are discovered once and re-read on each poll"""
+    _make_hwmon(tmp_path, 0, "coretemp", [("Package id 0", 52000), ("Core 0", 48500)])
+    _make_hwmon(tmp_path, 1, "amdgpu", [("edge", 61000)])
+    backend = _SensorsBackend(root=tmp_path)
+
+    readings = backend.read()
+    assert ("coretemp", "Package id 0", 52.0) in readings
+    assert ("amdgpu", "edge", 61.0) in readings
+
+    (tmp_path / "hwmon0" / "temp1_input").write_text("55000\n")
+    with patch('os.open', side_effect=AssertionError("inputs are held open")):
+        assert ("coretemp", "Package id 0", 55.0) in backend.read()
+
+    backend.close()
+    assert backend._inputs is None
+
+
+def test_sensors_backend_empty(tmp_path):
+    """No hwmon inputs means the caller should fall back to lm-sensors"""
+    assert _SensorsBackend(root=tmp_path).read() is None
+
+
+def test_thermal_zones_kept_open(tmp_path):
+    """Zone types are read once, ignored zones are never opened, temps are re-read in place"""
+    for i, (zone_type, temp) in enumerate([("cpu-thermal", 50000), ("gpu-thermal", 60000),
+                                            ("iwlwifi_1", 40000), ("acpitz", 30000)]):
+        zone = tmp_path / f"thermal_zone{i}"
+        zone.mkdir()
+        (zone / "type").write_text(zone_type + "\n")
+        (zone / "temp").write_text(f"{temp}\n")
+    zones = _ThermalZones(root=tmp_path)
+
+    try:
+        assert zones.read() == [("CPU", 50.0), ("GPU", 60.0)]
+        (tmp_path / "thermal_zone0" / "temp").write_text("55000\n")
+        (tmp_path / "thermal_zone0" / "type").write_text("renamed\n")
+        assert zones.read() == [("CPU", 55.0), ("GPU", 60.0)]
+    finally:
+        zones.close()
+
+
+@pytest.mark.parametrize("chip,label,expected", [
+    ("coretemp", "Package id 0", "CPU"),
+    ("k10temp", "Tctl", "CPU"),
+    ("amdgpu", "edge", "GPU"),
+    ("nct6775", "SYSTIN", "Motherboard"),
+    ("acpitz", "acpitz", None),
+])
+def test_classify_sensor(chip, label, expected):
+    assert _classify_sensor(chip, label) == expected
+
+
+def test_linux_temps_prefers_sysfs(heatmap):
+    """The sensors subprocess is not spawned when hwmon data is available"""
+    heatmap._sensors_backend.read = Mock(return_value=[("coretemp", "Package id 0", 88.0)])
+    with patch('subprocess.check_output', side_effect=FileNotFoundError) as mock_sub, \
+         patch('os.listdir', return_value=[]):
+        temps = heatmap.get_linux_temps()
+    assert temps['CPU'] >= 88.0
+    assert all(call.args[0][0] != 'sensors' for call in mock_sub.call_args_list)
+
+
+def test_macos_probes_run_concurrently(heatmap):
+    """powermetrics and system_profiler overlap instead of running back to back"""
+    both_running = threading.Barrier(2, timeout=5)
+    outputs = {
+        'sudo': b"CPU die temperature: 61.5 C\nGPU die temperature: 55.0 C\n",
+        'system_profiler': b"Hardware:\n  Model Name: MacBook Pro\n",
+    }
+
+    def fake_check_output(cmd, **kwargs):
+        both_running.wait()
+        return outputs[cmd[0]]
+
+    with patch('subprocess.check_output', side_effect=fake_check_output):
+        temps = heatmap.get_macos_temps()
+
+    assert temps['CPU'] == 61.5
+    assert temps['GPU'] == 55.0
+
+    pool = heatmap._io_pool
+    heatmap.close()
+    assert heatmap._io_pool is None
+    assert pool._shutdown
+
+
+def test_macos_probe_pool_released_without_close():
+    hm = SystemHeatmap()
+    with patch.object(hm, '_read_powermetrics', return_value=(None, [])), \
+         patch.object(hm, '_read_system_profiler_cpu', return_value=None):
+        hm.get_macos_temps()
+    pool = hm._io_pool
+
+    del hm
+    gc.collect()
+    assert pool._shutdown
+
+
+def test_wmi_sensors_queries_temperatures_only(heatmap):
+    sensors = [
+        FakeWMISensor('/intelcpu/0/temperature/0', 'CPU Package', 61.0),
+        FakeWMISensor('/lpc/nct6798d/temperature/1', 'Motherboard', 38.0),
+    ]
+    heatmap.wmi_connection = Mock()
+    heatmap.wmi_connection.query.return_value = sensors
+
+    assert heatmap._read_wmi_sensors() == [('CPU', 61.0), ('Motherboard', 38.0)]
+    assert "SensorType = 'Temperature'" in heatmap.wmi_connection.query.call_args[0][0]
+    heatmap.wmi_connection.Sensor.assert_not_called()
+
+
+def test_linux_storage_polled_on_slower_tier(heatmap):
+    heatmap._sensors_backend.read = Mock(return_value=[])
+    with patch.object(heatmap, '_get_storage_temp', return_value=41.0) as mock_storage:
+        first = heatmap.get_linux_temps()
+        second = heatmap.get_linux_temps()
+        heatmap._last_storage_ts -= heatmap.STORAGE_INTERVAL
+        heatmap.get_linux_temps()
+
+    assert mock_storage.call_count == 2
+    assert first['Storage'] >= 41.0 and second['Storage'] >= 41.0
+
+
+def test_lm_sensors_fallback_is_throttled(heatmap):
+    heatmap._sensors_backend.read = Mock(return_value=None)
+    readings = [("coretemp-isa-0000", "Package id 0", 99.0)]
+    with patch.object(heatmap, '_get_storage_temp', return_value=None), \
+         patch.object(heatmap, '_read_lm_sensors', return_value=readings) as mock_sensors:
+        first = heatmap.get_linux_temps()
+        second = heatmap.get_linux_temps()
+        heatmap._last_lm_sensors_ts -= heatmap.LM_SENSORS_INTERVAL
+        heatmap.get_linux_temps()
+
+    assert mock_sensors.call_count == 2
+    assert first['CPU'] == second['CPU'] == 99.0
+
+
+def test_smartctl_is_throttled(heatmap):
+    """smartctl runs off the caller's thread, at most once per SMART_INTERVAL, and never wakes standby disks"""
+    heatmap._block_devices = ['sda']
+    smart_output = b"194 Temperature_Celsius     0x0022   065   052   000    Old_age   Always       -       35\n"
+    with patch('subprocess.check_output', return_value=smart_output) as mock_sub, \
+         patch.object(Path, 'exists', return_value=True), \
+         patch.object(Path, 'glob', return_value=iter(())):
+        heatmap._get_storage_temp()
+        heatmap._smart_thread.join(timeout=5)
+        assert heatmap._get_storage_temp() == 35.0
+        assert heatmap._get_storage_temp() == 35.0
+    assert mock_sub.call_count == 1
+    assert '-n' in mock_sub.call_args[0][0] and 'standby' in mock_sub.call_args[0][0]
+
+
+def test_smart_output_parsed_as_bytes(heatmap):
+    heatmap._block_devices = ['nvme0n1']
+    smart_output = (b"Temperature:                        41 Celsius\n"
+                    b"Warning  Comp. Temperature Time:    0\n"
+                    b"Temperature Sensor 1:               45 Celsius\n")
+    with patch('subprocess.check_output', return_value=smart_output), \
+         patch.object(Path, 'exists', return_value=True):
+        assert heatmap._read_smart_temp() == 45.0
+
+
+def test_system_layout_panel_reused(heatmap, mock_system_temps):
+    first = heatmap.generate_system_layout(mock_system_temps)
+    first_text = first.renderable
+    first_plain, first_spans = first_text.plain, list(first_text.spans)
+
+    hotter = dict(mock_system_temps, Storage=95.0)
+    second = heatmap.generate_system_layout(hotter)
+
+    assert second is first
+    # The previous frame's Text is swapped out whole, not rewritten under a render
+    assert second.renderable is not first_text
+    assert first_text.plain == first_plain and first_text.spans == first_spans
+    assert "Sto 95.0°C" in second.renderable.plain
+    assert len(second.renderable.plain) == len(first_plain)
+    # Spans from the previous frame were dropped, not accumulated
+    assert len(second.renderable.spans) == sum(len(spans) for _, spans in heatmap._row_cache.values())
+
+
+def test_system_layout_animates_steady_readings(heatmap, mock_system_temps):
+    """Steady readings still get fresh noise each frame, so the map keeps moving"""
+    heatmap.generate_system_layout(mock_system_temps)
+    frame = heatmap._temps_flat.copy()
+
+    layout = heatmap.generate_system_layout(mock_system_temps)
+    assert not np.array_equal(heatmap._temps_flat, frame)
+    assert "Sto 30.0°C" in layout.renderable.plain
+
+
+def test_render_row_one_span_per_styled_run(heatmap):
+    row_styles = np.array([1, 1, 2, 0, 0, 4], dtype=np.uint8)
+
+    spans = heatmap._render_row(0, "··▒  C", row_styles)
+    assert [(s.start, s.end, s.style) for s in spans] == [
+        (0, 2, "green"), (2, 3, "yellow"), (5, 6, "white"),
+    ]
+
+    # Later rows are offset by the rows (and newlines) before them
+    spans = heatmap._render_row(2, "··▒  C", row_styles)
+    assert spans[0].start == 2 * (LAYOUT_COLS + 1)
+
+
+def test_storage_hwmon_inputs_globbed_once_and_held_open(heatmap, tmp_path):
+    temp_input = tmp_path / "temp1_input"
+    temp_input.write_bytes(b"41000\n")
+    heatmap._block_devices = ['nvme0n1']
+    with patch.object(Path, 'glob', return_value=iter([temp_input])) as mock_glob:
+        assert heatmap._get_storage_temp() == 41.0
+        temp_input.write_bytes(b"43000\n")
+        with patch('os.open', side_effect=AssertionError("input is held open")):
+            assert heatmap._get_storage_temp() == 43.0
+    mock_glob.assert_called_once()
+
+    heatmap._close_storage_hwmon()
+    assert heatmap._storage_hwmon_fds is None
+
+
+def test_system_layout_grid(heatmap, mock_system_temps):
+    """The rendered map is a full 25x40 grid with component labels"""
+    layout = heatmap.generate_system_layout(mock_system_temps)
+    lines = layout.renderable.plain.rstrip("\n").split("\n")
+
+    assert len(lines) == 25
+    assert all(len(line) == 40 for line in lines)
+    # 1000 cells, but far fewer spans once equal-colour runs are merged
+    assert len(layout.renderable.spans) < 1000
+    assert "Mot 40.0°C" in layout.renderable.plain
+    assert "Sto 30.0°C" in layout.renderable.plain
+
+
+def test_lhm_http_parses_data_json():
+    """LibreHardwareMonitor's data.json tree is mapped onto components by hardware icon"""
+    def sensor(sensor_id, text, value):
+        return {"id": sensor_id, "Text": text, "Value": value,
+                "ImageURL": "images/transparent.png", "Children": []}
+
+    tree = {"id": 0, "Text": "Sensor", "ImageURL": "", "Children": [
+        {"id": 1, "Text": "DESKTOP", "ImageURL": "images_icon/computer.png", "Children": [
+            {"id": 2, "Text": "Intel Core i7", "ImageURL": "images_icon/cpu.png", "Children": [
+                {"id": 3, "Text": "Temperatures", "ImageURL": "images_icon/temperature.png", "Children": [
+                    sensor(4, "CPU Package", "62,0 °C"),
+                    sensor(5, "Core #1", "58.0 °C"),
+                ]},
+                {"id": 6, "Text": "Load", "ImageURL": "images_icon/load.png", "Children": [
+                    sensor(7, "CPU Total", "12.0 %"),
+                ]},
+            ]},
+            {"id": 8, "Text": "NVIDIA GeForce", "ImageURL": "images_icon/nvidia.png", "Children": [
+                {"id": 9, "Text": "Temperatures", "ImageURL": "images_icon/temperature.png", "Children": [
+                    sensor(10, "GPU Core", "71.0 °C"),
+                ]},
+            ]},
+        ]},
+    ]}
+    response = Mock(status=200)
+    response.read.return_value = json.dumps(tree).encode()
+
+    lhm = _LhmHttp()
+    with patch.object(lhm, '_conn') as mock_conn:
+        mock_conn.getresponse.return_value = response
+        readings = lhm.read()
+        assert sorted(readings) == [('CPU', 58.0), ('CPU', 62.0), ('GPU', 71.0)]
+        assert lhm.read() == readings
+        assert mock_conn.request.call_count == 2
+
+
+def test_lhm_http_unavailable_backs_off():
+    """An unreachable LHM web server is not retried on every frame"""
+    lhm = _LhmHttp()
+    with patch.object(lhm, '_conn') as mock_conn:
+        mock_conn.request.side_effect = ConnectionRefusedError
+        assert lhm.read() is None
+        assert lhm.read() is None
+        assert mock_conn.request.call_count == 1
+
+
+def test_render_row_reuses_unchanged_rows(heatmap):
+    styles = np.array([1, 1, 2, 0], dtype=np.uint8)
+
+    first = heatmap._render_row(0, '··▒ ', styles)
+    assert heatmap._render_row(0, ''.join(['··', '▒ ']), styles.copy()) is first
+
+    styles[3] = 3
+    assert heatmap._render_row(0, '··▒ ', styles) is not first
+
+
+def test_temp_char_matches_grid_classification(shared_heatmap):
+    """Scalar and vectorised classification share one threshold table"""
+    from guro.core.heatmap import _CHAR_TABLE, _TEMP_BINS
+
+    temps = np.array([0.0, 44.9, 45.0, 69.9, 70.0, 100.0])
+    grid_chars = _CHAR_TABLE[np.digitize(temps, _TEMP_BINS)].tolist()
+    assert grid_chars == [shared_heatmap.get_temp_char(t)[0] for t in temps]
+
+
+def test_stats_panel_colors_each_component(mock_system_temps):
+    panel = SystemHeatmap._build_stats_panel({**mock_system_temps, 'CPU': 80.0})
+
+    table = panel.renderable
+    assert table.row_count == 5
+    assert list(table.columns[0].cells) == list(mock_system_temps)
+    assert list(table.columns[1].cells)[0] == "[red]80.0°C[/red]"
+    assert list(table.columns[1].cells)[1] == "[yellow]55.0°C[/yellow]"
+
+
+@pytest.mark.timeout(5)
+def test_heatmap_run_reuses_live(heatmap, mock_system_temps, fake_clock):
+    """Live is built once on the heatmap's console and restarted by later runs."""
+    with patch.object(heatmap, 'get_system_temps', return_value=mock_system_temps), \
+         patch('guro.core.heatmap.Live') as mock_live:
+        heatmap.run(interval=0.1, duration=0.2, clock=fake_clock, sleep=fake_clock.sleep)
+        heatmap.run(interval=0.1, duration=0.2, refresh_hz=2.0, clock=fake_clock, sleep=fake_clock.sleep)
+
+    mock_live.assert_called_once()
+    assert mock_live.call_args.kwargs['console'] is heatmap.console
+    assert mock_live.return_value.__enter__.call_count == 2
+    assert mock_live.return_value.refresh_per_second == 2.0
+
+
+@pytest.mark.parametrize("args,expected", [
+    (_ARGS_INTERVAL, {'interval': 0.5, 'duration': 2, 'refresh_hz': 2.0}),
+    (_ARGS_SAMPLE_HZ, {'interval': 0.25, 'duration': 1, 'refresh_hz': 1.0}),
+])
+def test_cli_heatmap_passes_options_to_run(args, expected):
+    with patch('guro.core.heatmap.SystemHeatmap.run', return_value=3) as mock_run:
+        result = _RUNNER.invoke(cli, args)
+
+    assert result.exit_code == 0
+    mock_run.assert_called_once_with(**expected)
+    assert "completed after 3 updates" in result.output
+
+
+def test_cli_heatmap_rejects_bad_interval():
+    with patch('guro.core.heatmap.SystemHeatmap.run') as mock_run:
+        result = _RUNNER.invoke(cli, _ARGS_BAD_INTERVAL)
+
+    assert result.exit_code == 2
+    mock_run.assert_not_called()
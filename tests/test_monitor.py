@@ -1,13 +1,17 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import platform
-import psutil
+import numpy as np
+import io
 import os
-import tempfile
-from typing import Dict, List
+import gc
+import threading
 
-from guro.core.monitor import SystemMonitor, GPUDetector, _safe_float
-from guro.core.utils import ASCIIGraph
+from rich.console import Console
+
+from guro.core.monitor import SystemMonitor, GPUDetector, _NvidiaSmiLoop, _safe_float
+from guro.core.utils import ASCIIGraph, BackgroundSampler, Sample, SystemFacts, system_facts
+from tests._fakes import FakeClock, FakeCPUFreq, FakeMemory
 
 
 @pytest.fixture
@@ -72,12 +76,17 @@ def test_nvidia_gpu_detection(mock_check_output):
 
     gpus = GPUDetector.get_nvidia_info()
 
-    assert isinstance(gpus, list)
-    if gpus:
-        assert 'name' in gpus[0]
-        assert 'memory_total' in gpus[0]
-        assert 'temperature' in gpus[0]
-        assert gpus[0]['type'] == 'NVIDIA'
+    assert gpus == [{
+        'name': 'GeForce RTX 3080',
+        'memory_total': 10240 * 1024**2,
+        'memory_used': 5120 * 1024**2,
+        'memory_free': 5120 * 1024**2,
+        'temperature': 65.0,
+        'utilization': 50.0,
+        'fan_speed': 75.0,
+        'power_draw': 200.0,
+        'type': 'NVIDIA',
+    }]
 
 
 @patch('subprocess.check_output')
@@ -125,6 +134,40 @@ def test_ascii_graph(ascii_graph):
     assert len(rendered) > 0
 
 
+def test_ascii_graph_levels():
+    """Values map onto the nine block levels and are clamped to 0-100"""
+    graph = ASCIIGraph(width=8)
+    for value in (-10, 0, 12.5, 50, 99.9, 100, 250):
+        graph.add_point(value)
+
+    plot_line = graph.render().split("\n")[3]
+    assert plot_line == "║   ▁▄▇██  ║"
+
+
+def test_ascii_graph_frame():
+    graph = ASCIIGraph(width=6)
+    graph.add_point(100)
+
+    assert graph.render("CPU") == (
+        "╔════════╗\n"
+        "║  CPU   ║\n"
+        "│ ────── │\n"
+        "║ █      ║\n"
+        "╚════════╝"
+    )
+    assert graph.render("CPU") == graph.render("CPU")
+
+
+def test_ascii_graph_ring_buffer_order():
+    """Once full, the oldest points are overwritten and order is preserved"""
+    graph = ASCIIGraph(width=4)
+    for value in range(6):
+        graph.add_point(value * 10)
+
+    assert graph.data.tolist() == [20.0, 30.0, 40.0, 50.0]
+    assert graph.data.dtype == np.float32
+
+
 def test_ascii_graph_empty():
     """Test ASCII graph with no data"""
     graph = ASCIIGraph()
@@ -132,32 +175,74 @@ def test_ascii_graph_empty():
     assert rendered == ""
 
 
-@patch('psutil.virtual_memory')
-def test_csv_export_uses_timestamp(mock_virtual_memory, monitor):
+def test_csv_export_uses_timestamp(monitor, tmp_path, monkeypatch):
     """Test that CSV export creates a timestamped file"""
-    mock_memory = MagicMock()
-    mock_memory.total = 16 * 1024**3
-    mock_memory.available = 8 * 1024**3
-    mock_memory.percent = 50.0
-    mock_virtual_memory.return_value = mock_memory
-
-    monitor.monitoring_data = [
-        {'timestamp': '2024-01-01T00:00:00', 'cpu_usage': 10.0, 'memory_usage': 50.0}
-    ]
-
-    # Export to a temp file using the explicit filepath parameter
-    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
-        filepath = f.name
-
-    try:
-        monitor.export_monitoring_data(filepath=filepath)
-        assert os.path.exists(filepath)
-        with open(filepath) as f:
-            content = f.read()
-            assert 'timestamp' in content
-            assert 'cpu_usage' in content
-    finally:
-        os.remove(filepath)
+    monkeypatch.chdir(tmp_path)
+
+    csvfile, writer, filepath = monitor.open_export()
+    writer.writerow({'timestamp': '2024-01-01T00:00:00', 'cpu_usage': 10.0, 'memory_usage': 50.0})
+    csvfile.close()
+
+    assert filepath.startswith('monitoring_data_') and filepath.endswith('.csv')
+    with open(tmp_path / filepath) as f:
+        content = f.read()
+        assert 'timestamp' in content
+        assert 'cpu_usage' in content
+        assert '2024-01-01T00:00:00' in content
+
+
+def test_run_queries_gpus_once_per_ttl(monitor):
+    """The dashboard does not re-query GPUs before the sampler's first pass"""
+    gpu_info = {'available': False, 'gpus': []}
+    with patch.object(GPUDetector, 'get_all_gpus', return_value=gpu_info) as mock_gpus, \
+         patch('guro.core.monitor.Live'), \
+         patch.object(monitor, '_get_process_table', return_value=None):
+        clock = FakeClock()
+        updates = monitor.run_performance_test(interval=0.5, duration=2, clock=clock, sleep=clock.sleep)
+
+    assert updates == 4
+    assert mock_gpus.call_count == 1
+
+
+def test_csv_export_streams_rows_during_run(monitor, tmp_path):
+    """Rows go through the background flusher and the file is closed on exit"""
+    filepath = tmp_path / "run.csv"
+    real_open_export = monitor.open_export
+
+    with patch.object(monitor, 'open_export', lambda: real_open_export(str(filepath))), \
+         patch('guro.core.monitor.Live'), \
+         patch.object(monitor, '_get_process_table', return_value=None):
+        clock = FakeClock()
+        monitor.run_performance_test(interval=0.5, duration=2, export_data=True,
+                                     clock=clock, sleep=clock.sleep)
+
+    rows = filepath.read_text().splitlines()
+    assert rows[0] == 'timestamp,cpu_usage,memory_usage'
+    assert len(rows) == 1 + 4
+
+    # The in-memory copy exports the same rows
+    monitor.export_monitoring_data(str(tmp_path / "copy.csv"))
+    assert (tmp_path / "copy.csv").read_text().splitlines() == rows
+
+
+def test_csv_export_queue_bounded_and_drops_reported(monitor, tmp_path):
+    """A stalled writer costs the oldest rows, not unbounded memory, and says so"""
+    filepath = tmp_path / "run.csv"
+    real_open_export = monitor.open_export
+
+    with patch.object(monitor, 'open_export', lambda: real_open_export(str(filepath))), \
+         patch('guro.core.monitor.EXPORT_QUEUE_MAXLEN', 1), \
+         patch('guro.core.monitor.EXPORT_FLUSH_INTERVAL', 60), \
+         patch('guro.core.monitor.Live'), \
+         patch.object(monitor, '_get_process_table', return_value=None), \
+         patch.object(monitor.console, 'print') as mock_print:
+        clock = FakeClock()
+        monitor.run_performance_test(interval=0.5, duration=2, export_data=True,
+                                     clock=clock, sleep=clock.sleep)
+
+    assert len(filepath.read_text().splitlines()) == 1 + 1
+    printed = [c.args[0] for c in mock_print.call_args_list]
+    assert any("3 oldest rows were dropped" in line for line in printed)
 
 
 @pytest.mark.skipif(platform.system() != 'Linux', reason="Linux-only test")
@@ -170,22 +255,64 @@ def test_cpu_temperature_linux(monitor):
         assert temp < 150
 
 
-@patch('platform.system')
-@patch('platform.release')
-@patch('platform.processor')
-def test_system_detection(mock_processor, mock_release, mock_system, monitor):
+def _fd_is_open(fd):
+    try:
+        os.fstat(fd)
+    except OSError:
+        return False
+    return True
+
+
+def test_cpu_temperature_fd_closed_and_reopened(tmp_path):
+    zone = tmp_path / "temp"
+    zone.write_text("52000\n")
+    with patch('guro.core.monitor._SYSTEM', 'Linux'), \
+         patch('guro.core.monitor.CPU_THERMAL_ZONE', str(zone)), \
+         patch('guro.core.monitor.GPUDetector.get_all_gpus', return_value={}):
+        monitor = SystemMonitor()
+        assert monitor._get_cpu_temperature() == 52.0
+        fd = monitor._cpu_temp_fd
+
+        monitor.close()
+        assert monitor._cpu_temp_fd is None and not _fd_is_open(fd)
+        monitor.close()  # idempotent
+
+        assert monitor._get_cpu_temperature() == 52.0
+        fd = monitor._cpu_temp_fd
+        del monitor
+        gc.collect()
+        assert not _fd_is_open(fd)
+
+
+@pytest.mark.parametrize("system, release", [('Linux', '5.10.0'), ('Windows', '10')])
+def test_system_detection(monitor, system, release):
     """Test system detection across different platforms"""
-    mock_system.return_value = 'Linux'
-    mock_release.return_value = '5.10.0'
-    mock_processor.return_value = 'x86_64'
+    facts = SystemFacts(system=system, release=release, processor='x86_64',
+                        physical_cores=4, logical_cores=8)
+    with patch('guro.core.monitor.system_facts', return_value=facts):
+        info = monitor.get_system_info()
 
-    info = monitor.get_system_info()
-    assert 'Linux' in info['os']
+    assert info['os'] == f"{system} {release}"
+    assert info['cpu_model'] == 'x86_64'
+    assert info['cpu_threads'] == 8
 
-    mock_system.return_value = 'Windows'
-    mock_release.return_value = '10'
-    info = monitor.get_system_info()
-    assert 'Windows' in info['os']
+
+@patch('psutil.cpu_freq')
+@patch('psutil.virtual_memory')
+def test_get_system_info_reuses_sample(mock_virtual_memory, mock_cpu_freq, monitor):
+    """A per-tick sample is used as-is instead of re-querying psutil"""
+    sample = Sample(
+        cpu_percent=12.5,
+        memory=FakeMemory(total=16 * 1024**3, available=4 * 1024**3, percent=75.0),
+        cpu_freq=FakeCPUFreq(current=3000.0),
+    )
+
+    info = monitor.get_system_info(sample)
+
+    assert info['cpu_freq'] == "3000.00MHz"
+    assert info['memory_available'] == "4.00GB"
+    mock_virtual_memory.assert_not_called()
+    mock_cpu_freq.assert_not_called()
 
 
 def test_error_handling():
@@ -205,3 +332,269 @@ def test_gpu_cache(monitor):
     # Immediately calling again should return the same cached info without subprocess calls
     info2 = monitor._refresh_gpu_info()
     assert info2 == info1
+
+
+def test_get_all_gpus_uses_ttl_cache():
+    """Repeated calls within CACHE_TTL must not spawn new subprocesses"""
+    GPUDetector.clear_cache()
+    try:
+        with patch('subprocess.check_output', side_effect=FileNotFoundError) as mock_sub:
+            first = GPUDetector.get_all_gpus()
+            calls = mock_sub.call_count
+            second = GPUDetector.get_all_gpus()
+            assert second is first
+            assert mock_sub.call_count == calls
+    finally:
+        GPUDetector.clear_cache()
+
+
+def test_clear_cache_stops_nvidia_loop():
+    """A cleared detector never reads the old looping nvidia-smi again"""
+    loop = MagicMock()
+    with patch.object(GPUDetector, '_nvidia_loop', loop), \
+         patch.object(GPUDetector, '_nvidia_loop_failed', True):
+        GPUDetector.clear_cache()
+
+        loop.close.assert_called_once()
+        assert GPUDetector._nvidia_loop is None
+        assert GPUDetector._nvidia_loop_failed == (platform.system() == "Windows")
+
+
+@patch.object(GPUDetector, '_nvidia_loop_failed', True)
+@patch('subprocess.check_output')
+def test_nvidia_dynamic_refresh(mock_check_output):
+    """After the first full query only dynamic fields are re-read"""
+    static = [{'name': 'GeForce RTX 3080', 'memory_total': 10240 * 1024**2, 'type': 'NVIDIA'}]
+    mock_check_output.return_value = b"70,90,6144,[N/A],250"
+
+    gpus = GPUDetector.get_nvidia_dynamic(static)
+
+    assert gpus[0]['name'] == 'GeForce RTX 3080'
+    assert gpus[0]['temperature'] == 70.0
+    assert gpus[0]['utilization'] == 90.0
+    assert gpus[0]['memory_used'] == 6144 * 1024**2
+    assert gpus[0]['memory_free'] == 4096 * 1024**2
+    assert gpus[0]['fan_speed'] is None
+    assert 'gpu_name' not in mock_check_output.call_args[0][0][1]
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason="non-blocking pipes are POSIX-only")
+def test_nvidia_smi_loop_reads_newest_block():
+    """Rows are drained without blocking and handed out one whole block at a time"""
+    read_fd, write_fd = os.pipe()
+    proc = MagicMock(stdout=os.fdopen(read_fd, 'rb'))
+    proc.poll.return_value = 0
+    with patch('subprocess.Popen', return_value=proc) as mock_popen:
+        loop = _NvidiaSmiLoop(gpu_count=2, period_ms=2000)
+    assert mock_popen.call_args[0][0][-2:] == ["-lms", "2000"]
+
+    try:
+        assert loop.read() == []
+        os.write(write_fd, b"70,90,6144,[N/A],250\n71,9")
+        assert loop.read() == []
+        os.write(write_fd, b"1,6000,40,200\n72,92,6100,41,210\n")
+        assert loop.read() == ["70,90,6144,[N/A],250", "71,91,6000,40,200"]
+        os.write(write_fd, b"73,93,6200,42,220\n")
+        assert loop.read() == ["72,92,6100,41,210", "73,93,6200,42,220"]
+    finally:
+        os.close(write_fd)
+    assert loop.read() is None
+
+
+@patch('subprocess.check_output')
+def test_nvidia_dynamic_prefers_loop_rows(mock_check_output):
+    static = [{'name': 'GeForce RTX 3080', 'memory_total': 10240 * 1024**2, 'type': 'NVIDIA'}]
+    with patch.object(GPUDetector, '_nvidia_loop_rows', return_value=["65,50,5120,30,200"]):
+        gpus = GPUDetector.get_nvidia_dynamic(static)
+
+    assert gpus[0]['temperature'] == 65.0
+    assert gpus[0]['memory_free'] == 5120 * 1024**2
+    mock_check_output.assert_not_called()
+
+
+class _FakeNVMLError(Exception):
+    pass
+
+
+def _fake_nvml(device_count=1):
+    nvml = MagicMock()
+    nvml.NVMLError = _FakeNVMLError
+    nvml.nvmlDeviceGetCount.return_value = device_count
+    nvml.nvmlDeviceGetName.return_value = b"NVIDIA GeForce RTX 3080"
+    nvml.nvmlDeviceGetMemoryInfo.return_value = MagicMock(
+        total=10240 * 1024**2, used=6144 * 1024**2, free=4096 * 1024**2)
+    nvml.nvmlDeviceGetUtilizationRates.return_value = MagicMock(gpu=90)
+    nvml.nvmlDeviceGetTemperature.return_value = 70
+    nvml.nvmlDeviceGetFanSpeed.side_effect = _FakeNVMLError("Not Supported")
+    nvml.nvmlDeviceGetPowerUsage.return_value = 250000
+    return nvml
+
+
+@patch('subprocess.check_output')
+def test_nvidia_info_via_nvml(mock_check_output):
+    """With NVML available the GPUs are read in-process, without nvidia-smi"""
+    nvml = _fake_nvml()
+    with patch('guro.core.monitor.pynvml', nvml), \
+         patch('guro.core.monitor.HAS_NVML', True), \
+         patch.object(GPUDetector, '_nvml_handles', None), \
+         patch.object(GPUDetector, '_nvml_failed', False), \
+         patch('atexit.register'):
+        gpus = GPUDetector._get_nvidia_gpus()
+        GPUDetector._get_nvidia_gpus()
+
+    mock_check_output.assert_not_called()
+    nvml.nvmlInit.assert_called_once()
+    assert gpus[0]['name'] == "NVIDIA GeForce RTX 3080"
+    assert gpus[0]['memory_used'] == 6144 * 1024**2
+    assert gpus[0]['temperature'] == 70
+    assert gpus[0]['utilization'] == 90.0
+    assert gpus[0]['fan_speed'] is None
+    assert gpus[0]['power_draw'] == 250.0
+
+
+@patch('subprocess.check_output')
+def test_nvidia_falls_back_to_smi_when_nvml_init_fails(mock_check_output):
+    nvml = _fake_nvml()
+    nvml.nvmlInit.side_effect = _FakeNVMLError("Driver Not Loaded")
+    mock_check_output.return_value = b"RTX 3080, 10240, 6144, 4096, 70, 90, 30, 250"
+    with patch('guro.core.monitor.pynvml', nvml), \
+         patch('guro.core.monitor.HAS_NVML', True), \
+         patch.object(GPUDetector, '_nvml_handles', None), \
+         patch.object(GPUDetector, '_nvml_failed', False), \
+         patch.object(GPUDetector, '_nvidia_static', None):
+        gpus = GPUDetector._get_nvidia_gpus()
+        assert GPUDetector._nvml_failed
+
+    assert gpus[0]['name'] == "RTX 3080"
+    assert mock_check_output.call_count == 1
+
+
+@patch('guro.core.monitor._SYSTEM', 'Linux')
+@patch('subprocess.check_output')
+def test_integrated_gpu_detection_cached(mock_check_output):
+    """lspci -mm output is parsed by PCI class and queried only once"""
+    mock_check_output.return_value = (
+        '0000:00:02.0 "VGA compatible controller" "Intel Corporation" "UHD Graphics 620" -r07 "Lenovo" "Device 2258"\n'
+        '0000:00:14.0 "USB controller" "Intel Corporation" "Sunrise Point-LP USB 3.0 xHCI Controller" -r21 "Lenovo" "Device 2258"\n'
+    )
+    GPUDetector.get_integrated_info.cache_clear()
+    try:
+        gpus = GPUDetector.get_integrated_info()
+        assert GPUDetector.get_integrated_info() is gpus
+        assert mock_check_output.call_count == 1
+        assert [g['name'] for g in gpus] == ["Intel Corporation UHD Graphics 620"]
+        assert gpus[0]['type'] == 'Integrated'
+        assert mock_check_output.call_args[0][0] == ["lspci", "-mm", "-D"]
+        assert 'shell' not in mock_check_output.call_args[1]
+    finally:
+        GPUDetector.get_integrated_info.cache_clear()
+
+
+def test_background_sampler_collects_off_thread():
+    """Probes run on the sampler thread; readers only see the latest value"""
+    calls = []
+    ticked = threading.Event()
+
+    def probe():
+        calls.append(threading.current_thread().name)
+        if len(calls) >= 3:
+            ticked.set()
+        return len(calls)
+
+    sampler = BackgroundSampler()
+    sampler.add('counter', probe, 0.01)
+    sampler.sample_now()
+    assert sampler.get('counter') == 1
+
+    sampler.start()
+    try:
+        assert ticked.wait(timeout=2)
+    finally:
+        sampler.stop()
+
+    assert sampler.get('counter') >= 3
+    assert 'guro-sampler' in calls[1:]
+
+
+def test_background_sampler_stop_reports_stuck_probe():
+    """stop() says whether the thread exited, so callers know a probe may still be running"""
+    entered, release = threading.Event(), threading.Event()
+
+    def probe():
+        entered.set()
+        release.wait(timeout=5)
+
+    sampler = BackgroundSampler()
+    sampler.add('slow', probe, 0)
+    sampler.start()
+    try:
+        assert entered.wait(timeout=2)
+        assert sampler.stop(timeout=0.01) is False
+    finally:
+        release.set()
+    assert BackgroundSampler().stop() is True
+
+
+def test_system_facts_read_once():
+    """platform/cpu_count lookups happen once per process, not per dashboard or call"""
+    system_facts.cache_clear()
+    try:
+        with patch('platform.processor', return_value='x86_64') as mock_processor:
+            first = system_facts()
+            assert system_facts() is first
+        assert mock_processor.call_count == 1
+        assert first.processor == 'x86_64'
+    finally:
+        system_facts.cache_clear()
+
+
+def test_background_sampler_probe_error_keeps_last_value():
+    """A failing probe leaves the previous sample in place"""
+    values = iter([42])
+
+    def probe():
+        return next(values)
+
+    sampler = BackgroundSampler()
+    sampler.add('value', probe, 60)
+    sampler.sample_now()
+    sampler.sample_now()  # StopIteration is logged, not raised
+    assert sampler.get('value') == 42
+    assert sampler.get('missing', 'default') == 'default'
+
+
+def _fake_process(pid, name, cpu):
+    proc = MagicMock()
+    proc.name.return_value = name
+    proc.cpu_percent.return_value = cpu
+    proc.memory_percent.return_value = 1.0
+    return proc
+
+
+def test_process_table_reuses_process_objects(monitor):
+    """Process handles are created once per PID and reused across refreshes"""
+    procs = {pid: _fake_process(pid, f"proc{pid}", float(pid)) for pid in range(1, 13)}
+    with patch('psutil.pids', return_value=list(procs)), \
+         patch('psutil.Process', side_effect=lambda pid: procs[pid]) as mock_process:
+        monitor._get_process_table()
+        table = monitor._get_process_table()
+
+    assert mock_process.call_count == 12
+    assert table.row_count == 10
+    console = Console(record=True, file=io.StringIO(), width=80)
+    console.print(table)
+    rows = [line.split() for line in console.export_text().splitlines()]
+    pids = [row[0] for row in rows if row and row[0].isdigit()]
+    assert pids == [str(pid) for pid in range(12, 2, -1)]
+
+
+def test_process_table_drops_exited_processes(monitor):
+    procs = {1: _fake_process(1, "init", 0.5), 2: _fake_process(2, "gone", 9.0)}
+    with patch('psutil.Process', side_effect=lambda pid: procs[pid]):
+        with patch('psutil.pids', return_value=[1, 2]):
+            monitor._get_process_table()
+        with patch('psutil.pids', return_value=[1]):
+            table = monitor._get_process_table()
+
+    assert set(monitor._proc_cache) == {1}
+    assert table.row_count == 1
@@ -1,14 +1,23 @@
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, mock_open
+import io
+import os
+import platform
+import signal
 import time
 import socket
+from collections import deque
 
 import psutil
+from rich.console import Console
 
 from guro.core.network import (
-    NetworkMonitor, _format_bytes, _format_speed, _sparkline, _get_proc_net_snmp,
+    NetworkMonitor, _ProcNetDev, _format_bytes, _format_speed, _sparkline, _get_proc_net_snmp,
+    _parse_proc_net_dev, _SeriesFlusher, SERIES_MAXLEN,
 )
 
+from tests._fakes import FakeClock
+
 
 class FakeAddr:
     def __init__(self, family, address, netmask=None, broadcast=None):
@@ -62,6 +71,8 @@ class TestFormatBytes:
         (1048576, "1.0 MB"),
         (1073741824, "1.0 GB"),
         (1099511627776, "1.0 TB"),
+        (1024 ** 5 * 3, "3.0 PB"),
+        (-2048, "-2.0 KB"),
     ])
     def test_format_bytes(self, value, expected):
         assert _format_bytes(value) == expected
@@ -128,12 +139,66 @@ class TestGetProcNetSnmp:
         assert result == {'tcp': {}, 'udp': {}}
 
 
+PROC_NET_DEV = (
+    b"Inter-|   Receive                                                |  Transmit\n"
+    b" face |bytes    packets errs drop fifo frame compressed multicast|"
+    b"bytes    packets errs drop fifo colls carrier compressed\n"
+    b"    lo:  123456     100    0    0    0     0          0         0   123456     100    0    0    0     0       0          0\n"
+    b"  eth0: 9876543    5000    1    2    0     0          0         0  1234567    4000    3    4    0     0       0          0\n"
+)
+
+
+class TestProcNetDev:
+    def test_parse(self):
+        counters = _parse_proc_net_dev(PROC_NET_DEV)
+        assert set(counters) == {'lo', 'eth0'}
+        assert counters['eth0'] == (1234567, 9876543)
+        assert (counters['eth0'].bytes_recv, counters['eth0'].bytes_sent) == (9876543, 1234567)
+
+    def test_parse_skips_malformed_lines(self):
+        data = PROC_NET_DEV + b"  bad0: 12 34\n garbage line\n"
+        assert set(_parse_proc_net_dev(data)) == {'lo', 'eth0'}
+
+    def test_reads_held_fd_from_start(self, tmp_path):
+        path = tmp_path / "dev"
+        path.write_bytes(PROC_NET_DEV)
+        with patch('guro.core.network._SYSTEM', 'Linux'):
+            reader = _ProcNetDev.open(str(path))
+
+        assert reader.read()['eth0'].bytes_sent == 1234567
+        path.write_bytes(PROC_NET_DEV.replace(b"1234567", b"7654321"))
+        assert reader.read()['eth0'].bytes_sent == 7654321
+
+    def test_buffer_grows_to_fit_file(self, tmp_path):
+        path = tmp_path / "dev"
+        path.write_bytes(PROC_NET_DEV)
+        with patch('guro.core.network._SYSTEM', 'Linux'), \
+             patch.object(_ProcNetDev, 'READ_SIZE', 16):
+            reader = _ProcNetDev.open(str(path))
+
+        assert reader.read() == _parse_proc_net_dev(PROC_NET_DEV)
+        buf = reader._buf
+        assert len(buf) >= len(PROC_NET_DEV)
+        reader.read()
+        assert reader._buf is buf
+
+    def test_not_linux(self):
+        with patch('guro.core.network._SYSTEM', 'Windows'):
+            assert _ProcNetDev.open() is None
+
+
 class TestNetworkMonitor:
+    @pytest.fixture(autouse=True)
+    def psutil_counters(self):
+        """Route counter reads through psutil so tests can mock net_io_counters"""
+        with patch.object(_ProcNetDev, 'open', return_value=None):
+            yield
+
     @pytest.fixture
     def monitor(self):
         m = NetworkMonitor()
         m._prev_io = {}
-        m._prev_time = time.time()
+        m._prev_time = time.monotonic()
         return m
 
     @patch('psutil.net_if_stats')
@@ -184,7 +249,7 @@ class TestNetworkMonitor:
         }
         m = NetworkMonitor()
         m._prev_io = {'eth0': FakeIO(bytes_sent=0, bytes_recv=0)}
-        m._prev_time = time.time() - 1.0
+        m._prev_time = time.monotonic() - 1.0
         m._ensure_history(['eth0'])
         speeds = m.get_speeds()
         assert 'eth0' in speeds
@@ -192,6 +257,19 @@ class TestNetworkMonitor:
         assert up == pytest.approx(1000.0, rel=1)
         assert down == pytest.approx(2000.0, rel=1)
 
+    @patch('psutil.net_io_counters')
+    def test_get_speeds_uses_measured_elapsed(self, mock_counters):
+        mock_counters.return_value = {
+            'eth0': FakeIO(bytes_sent=3000, bytes_recv=6000),
+        }
+        m = NetworkMonitor()
+        m._prev_io = {'eth0': FakeIO(bytes_sent=0, bytes_recv=0)}
+        m._prev_time = 100.0
+        speeds = m.get_speeds(now=102.0)
+        assert speeds['eth0'] == (1500.0, 3000.0)
+        assert m._prev_time == 102.0
+        assert mock_counters.call_args.kwargs['nowrap'] is True
+
     @patch('psutil.net_io_counters')
     def test_get_speeds_zero_elapsed(self, mock_counters):
         mock_counters.return_value = {
@@ -199,7 +277,7 @@ class TestNetworkMonitor:
         }
         m = NetworkMonitor()
         m._prev_io = {'eth0': FakeIO(bytes_sent=0, bytes_recv=0)}
-        m._prev_time = time.time()
+        m._prev_time = time.monotonic()
         m._ensure_history(['eth0'])
         speeds = m.get_speeds()
         assert 'eth0' in speeds
@@ -333,10 +411,13 @@ class TestNetworkMonitor:
         m = NetworkMonitor()
         m.running = True
         m._prev_io = {'eth0': FakeIO(bytes_sent=0, bytes_recv=0)}
-        m._prev_time = time.time()
+        m._prev_time = time.monotonic()
 
-        with patch('time.sleep', return_value=None):
-            m.run_dashboard(interval=0.01, duration=0.02)
+        clock = FakeClock()
+        with patch('guro.core.network.Live'):
+            ticks = m.run_dashboard(interval=0.5, duration=2, clock=clock, wait=clock.sleep)
+        assert ticks == 4
+        assert clock.now == 2.0
         assert m.running is False
 
     @patch('guro.core.network._get_proc_net_snmp')
@@ -346,7 +427,7 @@ class TestNetworkMonitor:
     @patch('psutil.net_if_addrs')
     def test_run_dashboard_export(
         self, mock_addrs, mock_stats, mock_counters,
-        mock_connections, mock_snmp
+        mock_connections, mock_snmp, tmp_path
     ):
         mock_stats.return_value = {'eth0': FakeStat(isup=True, speed=1000)}
         mock_addrs.return_value = {
@@ -361,39 +442,221 @@ class TestNetworkMonitor:
         m = NetworkMonitor()
         m.running = True
         m._prev_io = {'eth0': FakeIO(bytes_sent=0, bytes_recv=0)}
-        m._prev_time = time.time()
+        m._prev_time = time.monotonic()
+
+        clock = FakeClock()
+        with patch('guro.core.network.Live'), \
+             patch('guro.core.network._default_export_path', return_value=str(tmp_path / "net.csv")):
+            m.run_dashboard(interval=0.5, duration=2, export=True, clock=clock, wait=clock.sleep)
+
+        rows = (tmp_path / "net.csv").read_text().splitlines()
+        assert rows[0] == "timestamp,interface,upload_bps,download_bps"
+        assert [row.split(',')[:2] for row in rows[1:]] == [
+            ['0.0', 'eth0'], ['0.5', 'eth0'], ['1.0', 'eth0'], ['1.5', 'eth0'],
+        ]
+        assert len(m._series) == 0
+
+    @patch('guro.core.network.NetworkMonitor.get_interfaces')
+    def test_run_dashboard_export_never_left_open_by_early_interrupt(self, mock_interfaces, tmp_path):
+        """A Ctrl-C landing while the handler is installed leaves no flusher running"""
+        mock_interfaces.return_value = [
+            {'name': 'eth0', 'isup': True, 'speed': 1000, 'ipv4': [], 'ipv6': []},
+        ]
+        m = NetworkMonitor()
+        m._tty = True
+        clock = FakeClock()
+        with patch('guro.core.network.Live'), \
+             patch('guro.core.network.signal.signal', side_effect=KeyboardInterrupt), \
+             patch('guro.core.network._SeriesFlusher') as flusher_cls, \
+             patch('guro.core.network._default_export_path', return_value=str(tmp_path / "net.csv")):
+            flusher_cls.return_value.stop.return_value = 0
+            with pytest.raises(KeyboardInterrupt):
+                m.run_dashboard(interval=0.5, duration=2, export=True, clock=clock, wait=clock.sleep)
+
+        # Either never opened or stopped again: no thread or file outlives the call
+        assert flusher_cls.return_value.stop.call_count == flusher_cls.call_count
+
+    def test_adapter_and_history_tables_update_in_place(self):
+        interfaces = [
+            {'name': 'eth0', 'isup': True, 'speed': 1000, 'ipv4': ['10.0.0.1'], 'ipv6': []},
+            {'name': 'eth1', 'isup': False, 'speed': 0, 'ipv4': [], 'ipv6': []},
+        ]
+        m = NetworkMonitor()
+        m._ensure_history(['eth0'])
+        adapters = m._build_adapters_panel(interfaces, {}).renderable
+        history = m._build_history_panel(interfaces, {}).renderable
+        rows = adapters.rows
+
+        m._speed_history['eth0_up'].append(2048.0)
+        m._update_adapters_table({'eth0': (2048.0, 1024.0)})
+        m._update_history_table({'eth0': (2048.0, 1024.0)})
+
+        def plain(column):
+            return [str(cell) for cell in column.cells]
+
+        assert adapters.rows is rows and adapters.row_count == 2
+        assert plain(adapters.columns[4]) == ["2.0 KB/s", "0.0 B/s"]
+        assert plain(adapters.columns[5]) == ["1.0 KB/s", "0.0 B/s"]
+        assert history.row_count == 2
+        assert plain(history.columns[3]) == ["2.0 KB/s", "1.0 KB/s"]
+        up_spark = list(history.columns[2].cells)[0]
+        assert "█" in str(up_spark) and up_spark.style == "green"
+
+    @staticmethod
+    def _one_tick(m):
+        """get_speeds side effect that lets exactly one dashboard tick render"""
+        real_get_speeds = m.get_speeds
+
+        def get_speeds():
+            m.running = False
+            return real_get_speeds()
+        return get_speeds
+
+    @patch('guro.core.network._get_proc_net_snmp', return_value={'tcp': {}, 'udp': {}})
+    @patch('psutil.net_connections', return_value=[])
+    @patch('psutil.net_io_counters')
+    @patch('psutil.net_if_stats')
+    @patch('psutil.net_if_addrs')
+    def test_run_dashboard_plain_output_when_piped(
+        self, mock_addrs, mock_stats, mock_counters, mock_connections, mock_snmp
+    ):
+        mock_stats.return_value = {'eth0': FakeStat(isup=True)}
+        mock_addrs.return_value = {'eth0': [FakeAddr(family=2, address='10.0.0.1')]}
+        mock_counters.return_value = {'eth0': FakeIO(bytes_sent=2048, bytes_recv=1024)}
 
-        with patch('time.sleep', return_value=None):
-            with patch.object(m, 'export_csv') as mock_export:
-                m.run_dashboard(interval=0.01, duration=0.02, export=True)
-                assert len(m._export_data) > 0
-                mock_export.assert_called_once()
+        m = NetworkMonitor()
+        m._tty = False
+        m._console.file = io.StringIO()
+        with patch('guro.core.network.Live') as mock_live, \
+             patch.object(m, 'get_speeds', side_effect=self._one_tick(m)):
+            m.run_dashboard(interval=0.01)
+
+        mock_live.assert_not_called()
+        mock_connections.assert_not_called()
+        lines = m._console.file.getvalue().splitlines()
+        assert lines and all(line.split(',')[1] == 'eth0' for line in lines)
+
+    @patch('guro.core.network._get_proc_net_snmp', return_value={'tcp': {}, 'udp': {}})
+    @patch('psutil.net_connections', return_value=[])
+    @patch('psutil.net_io_counters')
+    @patch('psutil.net_if_stats')
+    @patch('psutil.net_if_addrs')
+    def test_run_dashboard_live_on_terminal(
+        self, mock_addrs, mock_stats, mock_counters, mock_connections, mock_snmp
+    ):
+        mock_stats.return_value = {'eth0': FakeStat(isup=True)}
+        mock_addrs.return_value = {'eth0': [FakeAddr(family=2, address='10.0.0.1')]}
+        mock_counters.return_value = {'eth0': FakeIO()}
+
+        m = NetworkMonitor()
+        m._tty = True
+        with patch('guro.core.network.Live') as mock_live, \
+             patch.object(m, 'get_speeds', side_effect=self._one_tick(m)):
+            m.run_dashboard(interval=0.01)
+
+        mock_live.assert_called_once()
+        assert mock_live.call_args.kwargs['auto_refresh'] is False
+        mock_live.return_value.refresh.assert_called_once()
+        assert mock_connections.called
+
+    @pytest.mark.skipif(platform.system() == 'Windows', reason="os.kill(SIGINT) is POSIX-only")
+    @pytest.mark.timeout(5)
+    @patch('psutil.net_if_stats', return_value={})
+    @patch('psutil.net_if_addrs', return_value={})
+    def test_run_dashboard_sigint_stops_loop(self, mock_addrs, mock_stats):
+        """A real SIGINT ends an unbounded run cleanly, says so and restores the old handler"""
+        m = NetworkMonitor()
+        m._tty = False
+        m._console.file = io.StringIO()
+        before = signal.getsignal(signal.SIGINT)
+
+        def interrupt():
+            os.kill(os.getpid(), signal.SIGINT)
+            return {}
+
+        with patch.object(m, 'get_speeds', side_effect=interrupt) as mock_speeds:
+            m.run_dashboard(interval=60)
+
+        mock_speeds.assert_called_once()
+        assert m.running is False
+        assert signal.getsignal(signal.SIGINT) is before
+        assert "Network monitoring stopped by user" in m._console.file.getvalue()
 
     def test_export_csv_no_data(self):
         m = NetworkMonitor()
-        m._export_data = []
         with patch.object(m._console, 'print') as mock_print:
             m.export_csv()
             mock_print.assert_called_once()
 
+    def test_export_csv_after_run_without_export(self, tmp_path):
+        """export_csv() writes the run's rows even when nothing was streamed"""
+        m = NetworkMonitor()
+        clock = FakeClock()
+        with patch.object(m, 'get_interfaces', return_value=[]), \
+             patch.object(m, 'get_speeds', return_value={'eth0': (1.0, 2.0)}), \
+             patch.object(m, '_plain_renderer', return_value=lambda elapsed, speeds: None):
+            m._tty = False
+            m.run_dashboard(interval=1.0, duration=2, clock=clock, wait=clock.sleep)
+
+        m.export_csv(str(tmp_path / "net.csv"))
+        assert (tmp_path / "net.csv").read_text().splitlines() == [
+            "timestamp,interface,upload_bps,download_bps",
+            "0.0,eth0,1.0,2.0",
+            "1.0,eth0,1.0,2.0",
+        ]
+
+    def test_series_is_bounded(self):
+        m = NetworkMonitor()
+        m._series.extend((i, 'eth0', 0.0, 0.0) for i in range(SERIES_MAXLEN + 10))
+        assert len(m._series) == SERIES_MAXLEN
+        assert m._series[0][0] == 10
+
+    def test_series_flusher_counts_dropped_rows(self, tmp_path):
+        series = deque(maxlen=2)
+        flusher = _SeriesFlusher(series, str(tmp_path / "out.csv"), every=60)
+        flusher.extend([(i, 'eth0', 0.0, 0.0) for i in range(5)])
+        assert flusher.stop() == 3
+        assert (tmp_path / "out.csv").read_text().splitlines()[1:] == [
+            "3,eth0,0.0,0.0", "4,eth0,0.0,0.0",
+        ]
+
+    def test_series_flusher_drains_in_background(self, tmp_path):
+        series = deque()
+        flusher = _SeriesFlusher(series, str(tmp_path / "out.csv"), every=0.01)
+        series.append((0.5, 'eth0', 1.0, 2.0))
+        deadline = time.monotonic() + 2
+        while series and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not series
+        flusher.stop()
+        assert (tmp_path / "out.csv").read_text().splitlines() == [
+            "timestamp,interface,upload_bps,download_bps", "0.5,eth0,1.0,2.0",
+        ]
+
     @patch('psutil.net_if_stats')
-    @patch('psutil.net_if_addrs')
-    def test_show_speed(self, mock_addrs, mock_stats):
+    def test_show_speed(self, mock_stats):
+        """The one-second sample window runs on a virtual clock"""
         mock_stats.return_value = {'eth0': FakeStat(isup=True, speed=1000)}
-        mock_addrs.return_value = {
-            'eth0': [FakeAddr(family=2, address='10.0.0.1')],
-        }
         m = NetworkMonitor()
-        m._prev_io = {'eth0': FakeIO(bytes_sent=1000, bytes_recv=2000)}
-        m._prev_time = time.time() - 1.0
-
-        with patch('psutil.net_io_counters') as mock_counters:
-            mock_counters.return_value = {
-                'eth0': FakeIO(bytes_sent=2000, bytes_recv=4000),
-            }
-            with patch.object(m._console, 'print') as mock_print:
-                m.show_speed()
-                mock_print.assert_called_once()
+        clock = FakeClock(100.0)
+
+        m._console = Console(record=True, file=io.StringIO(), width=80)
+
+        with patch('psutil.net_io_counters', side_effect=[
+                 {'eth0': FakeIO(bytes_sent=1000, bytes_recv=2000)},
+                 {'eth0': FakeIO(bytes_sent=2000, bytes_recv=4000)},
+             ]):
+            m.show_speed(clock=clock, wait=clock.sleep)
+
+        assert clock.now == 101.0
+        # Rendered rows of the HEAVY-box table: ┃ name ┃ upload ┃ download ┃
+        rows = {
+            cells[1]: cells[2:4]
+            for cells in ([c.strip() for c in line.split('┃')]
+                          for line in m._console.export_text().splitlines())
+            if len(cells) == 5
+        }
+        assert rows['eth0'] == [_format_speed(1000.0), _format_speed(2000.0)]
 
     @patch('psutil.net_connections')
     def test_show_connections_no_conns(self, mock_connections):